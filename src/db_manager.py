@@ -18,10 +18,16 @@
 # -------                           -------------
 # __init__()                        Creates the logging directory and initializes the SQLite database.
 # _connect_db()                     Establishes a connection to the database file.
-# _create_table()                   Creates the system_logs table if it doesn’t already exist.
 # log_snapshot(data)                Inserts or updates a system snapshot (timestamp + metrics).
-# get_all_logs()                    Returns all stored logs in chronological order.
-# clear_all_logs()                  Deletes all records from the log table.
+# log_snapshots(snapshots)          Bulk-inserts many snapshots via executemany in one transaction.
+# flush()                           Commits buffered inserts (for auto_commit=False batching).
+# iter_all_logs()                   Streams stored logs chronologically (bounded memory).
+# get_all_logs()                    Returns all stored logs (cached per data version).
+# data_version()                    Returns a counter that changes on every write.
+# get_logs_since(ts)                Returns only logs newer than the given timestamp.
+# latest_timestamp()                Returns the newest logged timestamp (or None).
+# resample_old_logs()               Aggregates old rows into the 5-minute average table.
+# clear_all_logs()                  Deletes all records from the log tables.
 # close()                           Closes the database connection safely.
 
 # Directory Structure
@@ -42,77 +48,432 @@
 
 import sqlite3
 import os
+import queue
+import threading
+from collections import namedtuple
+from operator import itemgetter
+from datetime import datetime
+from time import time
+
+# Compact snapshot record. Field access is a C-level offset instead of a
+# dict hash lookup, and being a plain tuple it binds positionally in
+# cursor.execute without any per-call unpacking.
+Snapshot = namedtuple("Snapshot", [
+    "timestamp", "cpu_percent", "ram_percent",
+    "ram_used_gb", "bytes_sent_gb", "bytes_recv_gb"
+])
+
+# Precomposed C-level extractor for dict snapshots: pulls all six fields in
+# one call instead of six separate subscript lookups.
+_extract_fields = itemgetter(*Snapshot._fields)
+
+# Hot-path SQL as module-level constants: the sqlite3 binding caches prepared
+# statements per SQL string, so reusing the exact same string object means
+# every call after the first hits the statement-cache fast path.
+# DO NOTHING on a timestamp collision: metric rows at the same second are
+# interchangeable, and skipping is cheaper than REPLACE's delete+insert.
+_INSERT_SQL = '''
+    INSERT INTO system_logs
+    (timestamp, cpu_percent, ram_percent, ram_used_gb, bytes_sent_gb, bytes_recv_gb)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(timestamp) DO NOTHING
+'''
+# Percentages are stored quantized (tenths of a percent, see _as_snapshot);
+# the SELECT rescales them so readers keep seeing plain percent floats.
+# Reads stitch two tables together: full-resolution rows from system_logs
+# (kept for the 7-day prune window) and the 5-minute averages that
+# resample_old_logs maintains, restricted to buckets lying entirely before
+# the oldest raw row so overlapping periods are never double-counted. The
+# IFNULL sentinel (INT64 max) makes the whole aggregate visible when the
+# raw table is empty.
+_SELECT_SQL = '''
+    SELECT timestamp, cpu_percent / 10.0, ram_percent / 10.0,
+           ram_used_gb, bytes_sent_gb, bytes_recv_gb
+    FROM system_metrics_5min
+    WHERE timestamp + 300 <= (SELECT IFNULL(MIN(timestamp), 9223372036854775807)
+                              FROM system_logs)
+    UNION ALL
+    SELECT timestamp, cpu_percent / 10.0, ram_percent / 10.0,
+           ram_used_gb, bytes_sent_gb, bytes_recv_gb
+    FROM system_logs ORDER BY timestamp ASC
+'''
+
+# Incremental variant: the primary key makes "newer than" a range scan
+# starting right after the given timestamp (bound twice, once per table).
+_SELECT_SINCE_SQL = '''
+    SELECT timestamp, cpu_percent / 10.0, ram_percent / 10.0,
+           ram_used_gb, bytes_sent_gb, bytes_recv_gb
+    FROM system_metrics_5min
+    WHERE timestamp > ?
+      AND timestamp + 300 <= (SELECT IFNULL(MIN(timestamp), 9223372036854775807)
+                              FROM system_logs)
+    UNION ALL
+    SELECT timestamp, cpu_percent / 10.0, ram_percent / 10.0,
+           ram_used_gb, bytes_sent_gb, bytes_recv_gb
+    FROM system_logs WHERE timestamp > ? ORDER BY timestamp ASC
+'''
+
+# Connection setup as one script: a single parse/execute round-trip applies
+# all pragmas and creates the table, instead of five separate execute calls.
+# WAL keeps readers from blocking the logging writer and avoids the
+# rollback-journal fsync on every commit; busy_timeout makes writers wait
+# instead of raising OperationalError; mmap_size serves full-table reads
+# via demand paging instead of per-page read() syscalls; cache_size (64 MB,
+# negative means KB) keeps the working set resident between repeated scans.
+# The prune trigger enforces a 7-day rolling window (604800 s) on every
+# insert — a range delete on the primary key — so the table stays small
+# enough for full scans to hit the page cache no matter how long the tool
+# has been running.
+_INIT_SCRIPT = '''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA temp_store=MEMORY;
+    CREATE TABLE IF NOT EXISTS system_logs (
+        timestamp INTEGER PRIMARY KEY,
+        cpu_percent INTEGER,
+        ram_percent INTEGER,
+        ram_used_gb REAL,
+        bytes_sent_gb REAL,
+        bytes_recv_gb REAL
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS system_metrics_5min (
+        timestamp INTEGER PRIMARY KEY,
+        cpu_percent INTEGER,
+        ram_percent INTEGER,
+        ram_used_gb REAL,
+        bytes_sent_gb REAL,
+        bytes_recv_gb REAL
+    ) WITHOUT ROWID;
+    CREATE TRIGGER IF NOT EXISTS prune_old_logs AFTER INSERT ON system_logs
+    BEGIN
+        DELETE FROM system_logs WHERE timestamp < NEW.timestamp - 604800;
+    END;
+'''
+
+# Number of pooled read-only connections; with WAL these can run SELECTs
+# concurrently while the single writer connection keeps logging.
+_READER_POOL_SIZE = 2
+
+
+def _as_snapshot(snapshot_data):
+    """
+    Normalizes a snapshot for insertion: converts dicts to Snapshot tuples
+    and coerces legacy "%Y-%m-%d %H:%M:%S" timestamp strings to epoch ints
+    (the timestamp column is an INTEGER PRIMARY KEY).
+    """
+    if isinstance(snapshot_data, dict):
+        snapshot_data = Snapshot._make(_extract_fields(snapshot_data))
+    elif not isinstance(snapshot_data, Snapshot):
+        snapshot_data = Snapshot(*snapshot_data)
+    if isinstance(snapshot_data.timestamp, str):
+        snapshot_data = snapshot_data._replace(timestamp=_timestamp_epoch(snapshot_data.timestamp))
+    # Quantize percentages to integer tenths (55.3 -> 553): same information,
+    # but small INTEGERs take 1-2 bytes in SQLite vs 8 for a REAL, so rows
+    # shrink and more of them fit per page.
+    return snapshot_data._replace(
+        cpu_percent=int(round(snapshot_data.cpu_percent * 10)),
+        ram_percent=int(round(snapshot_data.ram_percent * 10)),
+        ram_used_gb=float(snapshot_data.ram_used_gb),
+        bytes_sent_gb=float(snapshot_data.bytes_sent_gb),
+        bytes_recv_gb=float(snapshot_data.bytes_recv_gb)
+    )
+
+
+def _timestamp_epoch(ts):
+    """
+    Returns a timestamp as epoch seconds; legacy "%Y-%m-%d %H:%M:%S" string
+    rows are parsed on the fly.
+    """
+    if isinstance(ts, str):
+        try:
+            # Legacy TEXT columns hand epoch values back as digit strings
+            return int(ts)
+        except ValueError:
+            # fromisoformat is a C fast path; strptime would re-parse the
+            # format string through pure Python on every call
+            return int(datetime.fromisoformat(ts).timestamp())
+    return ts
+
+
+def _migrate_legacy_table(conn):
+    """
+    One-time in-place migration for databases created by the released
+    TEXT-timestamp schema: timestamps become epoch INTEGER primary keys
+    and percentages are quantized to integer tenths, so the /10.0 rescale
+    in _SELECT_SQL and the ORDER BY on the primary key are correct for
+    old rows too. No-op for databases already on the current schema.
+    """
+    cols = conn.execute("PRAGMA table_info(system_logs)").fetchall()
+    if not cols or cols[0][2].upper() != "TEXT":
+        return
+    rows = conn.execute(
+        "SELECT timestamp, cpu_percent, ram_percent,"
+        " ram_used_gb, bytes_sent_gb, bytes_recv_gb FROM system_logs"
+    ).fetchall()
+    conn.execute("DROP TABLE system_logs")  # Drops the prune trigger with it
+    conn.executescript(_INIT_SCRIPT)        # Recreate the current schema
+    conn.executemany(_INSERT_SQL, (_as_snapshot(r) for r in rows))
+    conn.commit()
+
+
+def format_timestamp(ts):
+    """
+    Formats an epoch-seconds timestamp for display. Legacy rows that still
+    contain "%Y-%m-%d %H:%M:%S" strings are passed through unchanged.
+    """
+    if isinstance(ts, str) and not ts.isdigit():
+        return ts
+    return datetime.fromtimestamp(int(ts)).strftime("%Y-%m-%d %H:%M:%S")
+
 
 class LoggingDBManager:
-    def __init__(self, db_path="PC_Diagnosis_Logs", db_name="system_metrics.db"):
+    def __init__(self, db_path="PC_Diagnosis_Logs", db_name="system_metrics.db", auto_commit=True,
+                 in_memory=False, async_writes=False):
         """
         Ensures the logging directory exists and initializes the SQLite database.
         Creates the directory if it doesn't exist, then connects to the DB and
         creates the system_logs table if needed.
+        With auto_commit=False, log_snapshot() only buffers rows; call flush()
+        (or use the manager as a context manager) to commit them in one
+        transaction, which is much faster for bursts of samples.
+        With in_memory=True, writes go to an in-memory shadow DB with zero
+        fsync cost; checkpoint() (and close()) copy it to the disk file, so
+        durability granularity equals the checkpoint interval.
+        With async_writes=True, log_snapshot() only enqueues the row and a
+        dedicated writer thread batches it to the disk file, so the sampling
+        thread never waits on a commit fsync.
         """
         self.log_dir = os.path.expanduser(db_path)  # Expand user (~) if present
         os.makedirs(self.log_dir, exist_ok=True)   # Create directory if missing
         self.db_name = os.path.join(self.log_dir, db_name)  # Full DB file path
+        self.auto_commit = auto_commit
+        self.in_memory = in_memory
         self.conn = None
-        self.cursor = None
-        self._connect_db()     # Establish DB connection
-        self._create_table()   # Create logs table if it doesn't exist
+        self._disk = None      # Disk connection backing the in-memory mode
+        self._connect_db()     # Establish DB connection, apply pragmas, create table
+
+        # Reader pool: writes go through self.conn (guarded by _write_lock),
+        # reads borrow a query-only connection so they never block the writer.
+        # In in_memory mode the data lives in the shadow DB that only
+        # self.conn can see, so reads go through it directly and no pool
+        # is created (pooled disk readers would miss uncheckpointed rows).
+        self._write_lock = threading.Lock()
+        self._readers = queue.Queue()
+        if not in_memory:
+            for _ in range(_READER_POOL_SIZE):
+                self._readers.put(self._connect_reader())
+
+        # Read-through cache for get_all_logs: several tabs read the full
+        # table on the same tick, so the list is materialized once per
+        # data version and shared. _data_version bumps on every write.
+        self._data_version = 0
+        self._logs_cache = None
+        self._logs_cache_version = -1
+
+        # Optional dedicated writer thread: log_snapshot enqueues, the loop
+        # below drains and commits in batches on its own connection.
+        self._write_queue = None
+        self._writer_thread = None
+        if async_writes:
+            self._write_queue = queue.Queue()
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
 
     def _connect_db(self):
         """
-        Connects to the SQLite database and creates a cursor.
-        Prints an error if connection fails.
+        Connects to the SQLite database.
+        Raises on failure: a manager without a connection is unusable, and
+        raising here lets the hot methods skip per-call cursor guards.
         """
         try:
-            self.conn = sqlite3.connect(self.db_name)
-            self.cursor = self.conn.cursor()
+            target = ":memory:" if self.in_memory else self.db_name
+            self.conn = sqlite3.connect(target, cached_statements=256,
+                                        check_same_thread=False)
+            if self.in_memory:
+                # Disk twin of the shadow DB; checkpoint() backs up into it
+                self._disk = sqlite3.connect(self.db_name, check_same_thread=False)
+                self._disk.executescript(_INIT_SCRIPT)
+                _migrate_legacy_table(self._disk)
+                # Seed the shadow with the existing history BEFORE any
+                # write: checkpoint() replaces the disk file wholesale, so
+                # starting from an empty shadow would wipe out every row
+                # logged by earlier sessions on the first checkpoint
+                self._disk.backup(self.conn)
+            self.conn.executescript(_INIT_SCRIPT)  # Pragmas + table in one pass
+            _migrate_legacy_table(self.conn)       # Convert pre-epoch databases
             # print(f"Database '{self.db_name}' successfully initialized.")
         except sqlite3.Error as e:
             print(f"Error connecting to database: {e}")
-            self.conn = None
-            self.cursor = None
-
-    def _create_table(self):
-        """
-        Creates the 'system_logs' table with columns for timestamp and metrics.
-        Uses IF NOT EXISTS to avoid errors if table is already there.
-        """
-        if self.cursor:
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS system_logs (
-                    timestamp TEXT PRIMARY KEY,
-                    cpu_percent REAL,
-                    ram_percent REAL,
-                    ram_used_gb REAL,
-                    bytes_sent_gb REAL,
-                    bytes_recv_gb REAL
-                )
-            ''')
-            self.conn.commit()
+            raise
+
+    def _connect_reader(self):
+        """
+        Opens a read-only connection for the pool. query_only makes misuse
+        impossible and lets SQLite skip write-lock bookkeeping.
+        """
+        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        conn.execute("PRAGMA query_only=true")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        return conn
+
+    def _acquire_reader(self):
+        """
+        Borrows a connection for a read. Pool connection normally; the
+        shadow connection itself in in_memory mode, where rows have not
+        reached the disk file yet.
+        """
+        if self.in_memory:
+            return self.conn
+        return self._readers.get()
+
+    def _release_reader(self, reader):
+        """Returns a borrowed read connection to the pool."""
+        if reader is not self.conn:
+            self._readers.put(reader)
 
     def log_snapshot(self, snapshot_data):
         """
         Inserts or replaces a snapshot entry into the system_logs table.
-        snapshot_data should be a dict containing:
-          timestamp, cpu_percent, ram_percent, ram_used_gb, bytes_sent_gb, bytes_recv_gb
+        snapshot_data is a Snapshot tuple (preferred, binds positionally) or
+        a dict with the same field names as keys.
         """
-        if self.cursor:
-            try:
-                self.cursor.execute('''
-                    INSERT OR REPLACE INTO system_logs 
-                    (timestamp, cpu_percent, ram_percent, ram_used_gb, bytes_sent_gb, bytes_recv_gb)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    snapshot_data["timestamp"],
-                    snapshot_data["cpu_percent"],
-                    snapshot_data["ram_percent"],
-                    snapshot_data["ram_used_gb"],
-                    snapshot_data["bytes_sent_gb"],
-                    snapshot_data["bytes_recv_gb"]
+        if self._write_queue is not None:
+            # Async mode: hand the row to the writer thread and return at once
+            self._write_queue.put(_as_snapshot(snapshot_data))
+            return
+        try:
+            with self._write_lock:
+                self.conn.execute(_INSERT_SQL, _as_snapshot(snapshot_data))
+                if self.auto_commit:
+                    self.conn.commit()
+            self._data_version += 1
+        except sqlite3.Error as e:
+            print(f"Error writing log entry: {e}")
+
+    def log_snapshots(self, snapshots):
+        """
+        Inserts many snapshot dicts in one executemany call and one commit.
+        Much faster than calling log_snapshot per row because statement
+        preparation and the commit fsync are paid only once for the batch.
+        """
+        try:
+            with self._write_lock:
+                self.conn.executemany(_INSERT_SQL, (
+                    _as_snapshot(s) for s in snapshots
                 ))
                 self.conn.commit()
-            except sqlite3.Error as e:
-                print(f"Error writing log entry: {e}")
+            self._data_version += 1
+        except sqlite3.Error as e:
+            print(f"Error writing log entries: {e}")
+
+    def _writer_loop(self):
+        """
+        Drains the write queue on a dedicated thread, batching up to 100 rows
+        or 1 second per commit. Normally runs on its own connection against
+        the disk file, so commit fsyncs never stall the thread that calls
+        log_snapshot. In in_memory mode it must write through the shared
+        shadow connection instead - a second connection would open its own
+        private :memory: database and every batch would be invisible to
+        reads and lost on close. A None item shuts the loop down.
+        """
+        if self.in_memory:
+            conn = self.conn
+        else:
+            conn = sqlite3.connect(self.db_name)
+            conn.execute("PRAGMA busy_timeout=5000")
+        try:
+            while True:
+                row = self._write_queue.get()
+                if row is None:
+                    return
+                batch = [row]
+                deadline = time() + 1.0
+                stop = False
+                while len(batch) < 100:
+                    remaining = deadline - time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        nxt = self._write_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        stop = True
+                        break
+                    batch.append(nxt)
+                try:
+                    # The shared shadow connection needs the write lock;
+                    # the private disk connection takes it too for symmetry
+                    # (uncontended, so effectively free)
+                    with self._write_lock:
+                        conn.executemany(_INSERT_SQL, batch)
+                        conn.commit()
+                    self._data_version += 1  # Atomic under the GIL
+                except sqlite3.Error as e:
+                    print(f"Error writing log entries: {e}")
+                if stop:
+                    return
+        finally:
+            if conn is not self.conn:
+                conn.close()
+
+    def checkpoint(self):
+        """
+        Copies the in-memory shadow DB to the disk file via SQLite's online
+        backup API. No-op when not running in_memory. Call this on a timer
+        or row-count threshold; samples logged since the last checkpoint are
+        the most that a crash can lose.
+        """
+        if self._disk is None or not self.conn:
+            return
+        with self._write_lock:
+            self.conn.commit()
+            self.conn.backup(self._disk)
+
+    def flush(self):
+        """
+        Commits any buffered log entries. Only needed when auto_commit=False;
+        grouping many inserts into one commit avoids an fsync per row.
+        """
+        if self.conn:
+            self.conn.commit()
+            # The pooled readers only see committed rows, so a get_all_logs()
+            # between insert and commit may have cached the old result under
+            # the already-bumped version; invalidate it now
+            self._data_version += 1
+
+    def __enter__(self):
+        """
+        Context-manager entry; use as 'with LoggingDBManager(...) as db:'.
+        Combine with auto_commit=False to batch all inserts in the block
+        into the single commit performed on exit.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Context-manager exit: commits pending inserts (or rolls back if an
+        exception occurred) and closes the connections, so leaving the block
+        can never lose buffered rows or leak an open transaction.
+        """
+        if self.conn and exc_type is not None:
+            self.conn.rollback()
+        self.close()
+        return False
+
+    def __del__(self):
+        """
+        Fallback cleanup if close() was never called; commits pending rows.
+        """
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def log_system_metrics(self, cpu, ram, used_gb, sent, recv):
         """
@@ -124,48 +485,213 @@ class LoggingDBManager:
           sent  - Bytes sent in GB
           recv  - Bytes received in GB
         """
-        from datetime import datetime
-        snapshot = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "cpu_percent": cpu,
-            "ram_percent": ram,
-            "ram_used_gb": used_gb,
-            "bytes_sent_gb": sent,
-            "bytes_recv_gb": recv
-        }
+        snapshot = Snapshot(
+            timestamp=int(time()),
+            cpu_percent=cpu,
+            ram_percent=ram,
+            ram_used_gb=used_gb,
+            bytes_sent_gb=sent,
+            bytes_recv_gb=recv
+        )
         self.log_snapshot(snapshot)
         return True
 
+    def iter_all_logs(self):
+        """
+        Streams log entries ordered by timestamp ascending as a generator.
+        Only fetches arraysize rows at a time, so memory stays bounded and
+        the first row arrives without waiting for the full table scan.
+        """
+        reader = self._acquire_reader()  # Borrow a read connection
+        try:
+            cursor = reader.execute(_SELECT_SQL)
+            cursor.arraysize = 1000  # Rows fetched per round-trip
+            yield from cursor
+        except sqlite3.Error as e:
+            print(f"Error fetching logs: {e}")
+        finally:
+            self._release_reader(reader)  # Return it to the pool
+
     def get_all_logs(self):
         """
         Retrieves all log entries ordered by timestamp ascending.
-        Returns a list of tuples or an empty list on failure.
+        Returns a list of tuples or an empty list on failure. The list is
+        cached per data version, so multiple consumers reading on the same
+        tick share one table scan; treat the result as read-only.
         """
-        if self.cursor:
-            try:
-                self.cursor.execute("SELECT * FROM system_logs ORDER BY timestamp ASC")
-                return self.cursor.fetchall()
-            except sqlite3.Error as e:
-                print(f"Error fetching logs: {e}")
-        return []
+        version = self._data_version
+        if self._logs_cache is None or self._logs_cache_version != version:
+            self._logs_cache = list(self.iter_all_logs())
+            self._logs_cache_version = version
+        return self._logs_cache
+
+    def data_version(self):
+        """
+        Returns a counter that changes whenever the table contents change.
+        Consumers can skip re-rendering when it has not moved.
+        """
+        return self._data_version
+
+    def get_logs_since(self, ts):
+        """
+        Retrieves only log entries newer than the given epoch timestamp,
+        ordered ascending. A primary-key range scan, so callers that
+        remember their last seen timestamp pay O(new rows) per poll
+        instead of rereading the whole table.
+        """
+        reader = self._acquire_reader()
+        try:
+            cursor = reader.execute(_SELECT_SINCE_SQL, (ts, ts))
+            cursor.arraysize = 1000
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error fetching logs since {ts}: {e}")
+            return []
+        finally:
+            self._release_reader(reader)
+
+    def latest_timestamp(self):
+        """
+        Returns the newest logged timestamp, or None when the table is
+        empty. MAX over the primary key is a single B-tree descent.
+        """
+        reader = self._acquire_reader()
+        try:
+            row = reader.execute("SELECT MAX(timestamp) FROM system_logs").fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            print(f"Error fetching latest timestamp: {e}")
+            return None
+        finally:
+            self._release_reader(reader)
+
+    def get_all_logs_numpy(self):
+        """
+        Returns all logs as a dict of preallocated NumPy column arrays
+        (structure-of-arrays layout). Downstream aggregation (mean CPU,
+        percentiles, plotting) then runs as vectorized operations on
+        contiguous arrays instead of looping over row tuples. numpy is
+        imported lazily so the storage module itself does not depend on
+        it; only callers of this method pay for (and need) it.
+        """
+        import numpy as np
+        reader = self._acquire_reader()
+        try:
+            n = reader.execute('''
+                SELECT (SELECT COUNT(*) FROM system_logs) +
+                       (SELECT COUNT(*) FROM system_metrics_5min
+                        WHERE timestamp + 300 <=
+                              (SELECT IFNULL(MIN(timestamp),
+                                             9223372036854775807)
+                               FROM system_logs))
+            ''').fetchone()[0]
+            columns = {
+                "timestamp": np.empty(n, np.int64),
+                "cpu_percent": np.empty(n, np.float32),
+                "ram_percent": np.empty(n, np.float32),
+                "ram_used_gb": np.empty(n, np.float32),
+                "bytes_sent_gb": np.empty(n, np.float32),
+                "bytes_recv_gb": np.empty(n, np.float32),
+            }
+            ts, cpu, ram, ram_gb, sent, recv = columns.values()
+            cursor = reader.execute(_SELECT_SQL)
+            cursor.arraysize = 10000
+            i = 0
+            while True:
+                # Fill the column arrays one fetchmany block at a time:
+                # slice assignment converts each block in C instead of six
+                # scalar stores per row
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                # The COUNT above and this scan are separate statements, so
+                # a commit in between can grow or shrink the result set.
+                # Clamp to the preallocated size rather than overrunning it;
+                # the dropped (or missing) rows show up on the next call.
+                if i + len(batch) > n:
+                    batch = batch[:n - i]
+                    if not batch:
+                        break
+                j = i + len(batch)
+                block = np.asarray(batch, dtype=object)
+                ts[i:j] = [_timestamp_epoch(v) for v in block[:, 0]]
+                cpu[i:j] = block[:, 1].astype(np.float32)
+                ram[i:j] = block[:, 2].astype(np.float32)
+                ram_gb[i:j] = block[:, 3].astype(np.float32)
+                sent[i:j] = block[:, 4].astype(np.float32)
+                recv[i:j] = block[:, 5].astype(np.float32)
+                i = j
+            if i < n:  # Rows vanished since the COUNT; drop the unfilled tail
+                columns = {k: v[:i] for k, v in columns.items()}
+            return columns
+        except sqlite3.Error as e:
+            print(f"Error fetching logs: {e}")
+            return {}
+        finally:
+            self._release_reader(reader)
+
+    def resample_old_logs(self, bucket_s=300, keep_raw_s=3600):
+        """
+        Aggregates rows older than keep_raw_s seconds into the separate
+        system_metrics_5min table (one averaged row per bucket_s bucket).
+        Raw rows stay untouched — the Logs tab and CSV export keep full
+        resolution until the 7-day prune trigger ages them out — while
+        the aggregate table preserves a bounded-size history beyond the
+        raw window. Idempotent: the bucket timestamp is the primary key
+        and existing buckets are skipped.
+        """
+        cutoff = int(time()) - keep_raw_s
+        try:
+            with self._write_lock:
+                self.conn.execute('''
+                    INSERT OR IGNORE INTO system_metrics_5min
+                    SELECT timestamp / ? * ?,
+                           CAST(AVG(cpu_percent) AS INTEGER),
+                           CAST(AVG(ram_percent) AS INTEGER),
+                           AVG(ram_used_gb), AVG(bytes_sent_gb), AVG(bytes_recv_gb)
+                    FROM system_logs WHERE timestamp < ?
+                    GROUP BY timestamp / ?
+                ''', (bucket_s, bucket_s, cutoff, bucket_s))
+                self.conn.commit()
+            self._data_version += 1
+        except sqlite3.Error as e:
+            print(f"Error resampling logs: {e}")
 
     def clear_all_logs(self):
         """
         Deletes all records from the system_logs table.
         """
-        if self.cursor:
-            try:
-                self.cursor.execute("DELETE FROM system_logs")
+        try:
+            with self._write_lock:
+                self.conn.execute("DELETE FROM system_logs")
+                self.conn.execute("DELETE FROM system_metrics_5min")
                 self.conn.commit()
-                # print("All logs successfully deleted.")
-            except sqlite3.Error as e:
-                print(f"Error deleting logs: {e}")
+            self._data_version += 1
+            # print("All logs successfully deleted.")
+        except sqlite3.Error as e:
+            print(f"Error deleting logs: {e}")
 
     def close(self):
         """
-        Safely closes the database connection.
+        Safely closes the writer connection and the pooled readers.
+        Any still-buffered inserts are committed first.
         """
+        if self._writer_thread is not None:
+            self._write_queue.put(None)     # Sentinel: drain and stop
+            self._writer_thread.join(timeout=5)
+            self._writer_thread = None
         if self.conn:
+            self.flush()        # Commit rows buffered under auto_commit=False
+            self.checkpoint()   # Persist the in-memory shadow DB, if any
             self.conn.close()
+            self.conn = None
             # print("Database connection closed.")
+        if self._disk:
+            self._disk.close()
+            self._disk = None
+        while not self._readers.empty():
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
 
@@ -26,6 +26,9 @@
 # - CPULayout               : Detailed CPU metrics, including per-core usage.
 # - MemoryLayout            : RAM and swap usage details.
 # - NetworkLayout           : Network summary and interface details.
+# - DiagnosisTableModel     : Base table model shared by the QTableView-backed tabs.
+# - ProcessTableModel       : Model holding the process rows.
+# - LogsTableModel          : Model holding the logged metric rows.
 # - ProcessesLayout         : Live process table with resource usage.
 # - ProgramsLayout          : List of installed programs.
 # - LogsLayout              : Table view of logged system metrics, with export/clear options.
@@ -53,11 +56,14 @@
 # Import necessary PyQt6 components for UI creation
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar,
-    QGridLayout, QTableWidget, QTableWidgetItem, QHeaderView,
+    QGridLayout, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QScrollArea, QPushButton, QTabWidget, QDialog, QMessageBox,
-    QFileDialog, QAbstractItemView
+    QFileDialog, QAbstractItemView, QGraphicsItem, QListView
+)
+from PyQt6.QtCore import (
+    Qt, QDateTime, QLocale, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QObject, pyqtSignal, QStringListModel
 )
-from PyQt6.QtCore import Qt, QDateTime, QLocale
 from PyQt6.QtGui import QColor, QPalette
 
 # Import system monitoring and utility libraries
@@ -65,23 +71,152 @@ import psutil
 import platform
 import os
 import csv
+import functools
+import time
 from datetime import datetime
 import pyqtgraph as pg  # For advanced plotting
 import numpy as np
 
+from src.db_manager import format_timestamp
+
+try:
+    import numba  # Optional: JIT-compiles the downsampling hot loop
+except ImportError:
+    numba = None
+
+# OS identity never changes at runtime (and platform.version() can shell out
+# on Windows), so compute these once at import instead of on every refresh.
+_OS_STR = f"{platform.system()} {platform.release()} ({platform.version()})"
+_IS_WINDOWS = platform.system() == "Windows"
+_DISK_ROOT = 'C:\\' if _IS_WINDOWS else '/'
+
+# Precomputed reciprocal: bytes-to-GB becomes one multiply, and the :.2f
+# display format already rounds, so no explicit round() call is needed.
+_GB = 1.0 / (1 << 30)
+
+
+def _prefixed_label(prefix):
+    """
+    Creates a QLabel whose bold rich-text prefix never changes. The text
+    format is pinned once so Qt skips per-setText format auto-detection;
+    update_data only concatenates the dynamic tail onto the stored prefix.
+    """
+    label = QLabel(prefix)
+    label.setTextFormat(Qt.TextFormat.RichText)
+    return label
+
+
+class SystemSampler(QObject):
+    """
+    Collects all psutil-backed metrics in one pass and emits them as a
+    dict. Lives on a worker QThread so process iteration and the blocking
+    cpu_percent intervals never stall the GUI event loop; widgets receive
+    the finished data via the sampled signal (queued across threads).
+    When a db_manager is supplied, the snapshot is also logged here, so
+    the commit fsync happens off the GUI thread as well (the manager's
+    connections are cross-thread safe and writes take its write lock).
+    """
+    sampled = pyqtSignal(dict)
+
+    _RESAMPLE_EVERY = 50  # Samples between old-log resampling runs
+
+    def __init__(self, system_info_fetcher, db_manager=None, parent=None):
+        super().__init__(parent)
+        self.system_info_fetcher = system_info_fetcher
+        self.db_manager = db_manager
+        self._sample_count = 0
+
+    def sample(self):
+        fetcher = self.system_info_fetcher
+        data = {
+            "snapshot": fetcher.get_system_snapshot(),
+            "cpu": fetcher.get_cpu_info(),
+            "memory": fetcher.get_memory_info(),
+            "network": fetcher.get_network_info(),
+            "io_rates": fetcher.get_network_io_rates(),
+            "processes": fetcher.get_processes_info(),
+            "programs": fetcher.get_installed_programs(),
+        }
+        if self.db_manager is not None:
+            # Committed before the emit, so tabs reading the DB on this
+            # sample already see the new row
+            self.db_manager.log_snapshot(data["snapshot"])
+            self._sample_count += 1
+            if self._sample_count % self._RESAMPLE_EVERY == 0:
+                # Periodic housekeeping, also off the GUI thread: keep the
+                # 5-minute aggregate table up to date (non-destructive; raw
+                # rows stay until the 7-day prune window expires)
+                self.db_manager.resample_old_logs()
+        self.sampled.emit(data)
+
 
 # Base class for all information widgets
 class BaseInfoWidget(QWidget):
     def __init__(self, system_info_fetcher, parent=None):
         super().__init__(parent)
         self.system_info_fetcher = system_info_fetcher  # Data source
+        self._last_version = None  # Fetcher snapshot version last rendered
+        self._sample = None  # Latest SystemSampler payload, if any
+        self._dirty = False  # Payload stored while hidden, not rendered yet
+        self._last_refresh_ns = 0  # For rate-limiting sampler deliveries
+        self._min_interval_ns = 500_000_000  # At most one refresh per 500 ms
         self.setup_ui()  # Initialize UI components
-        self.update_data()  # Load initial data
+        # No eager update_data() here: the first refresh arrives from the
+        # sampler thread, so construction never blocks on psutil calls
 
     def setup_ui(self):
         """Must be implemented by subclasses to create UI layout"""
         raise NotImplementedError("setup_ui must be implemented in subclasses")
 
+    def apply_sample(self, data):
+        """Slot for SystemSampler.sampled: stores the pre-fetched metrics
+        and refreshes the widget from them on the GUI thread. Deliveries
+        arriving faster than the minimum interval are dropped so bursty
+        sampling cannot pile up redundant repaints."""
+        now = time.monotonic_ns()
+        if now - self._last_refresh_ns < self._min_interval_ns:
+            return
+        self._last_refresh_ns = now
+        self._sample = data
+        self._dirty = False
+        self.update_data()
+
+    def defer_sample(self, data):
+        """Stores a sampler payload without rendering it. Hidden tabs take
+        this path so only the visible tab pays update_data per tick; the
+        stored data is shown by refresh_if_dirty when the tab surfaces."""
+        self._sample = data
+        self._dirty = True
+
+    def refresh_if_dirty(self):
+        """Renders the deferred payload, if any (tab became visible)."""
+        if self._dirty:
+            self._dirty = False
+            self.update_data()
+
+    def _sample_get(self, key, fallback):
+        """
+        Returns the pre-fetched value for key from the latest sampler
+        payload, or calls fallback() when the widget is driven without a
+        sampler (initial construction, standalone use). The fallback
+        blocks, which is exactly what the sampler path avoids.
+        """
+        if self._sample is not None and key in self._sample:
+            return self._sample[key]
+        return fallback()
+
+    def snapshot_changed(self):
+        """
+        Returns True when the fetcher has taken a new snapshot since this
+        widget last rendered one. Subclasses call this at the top of
+        update_data so idle timer ticks cost nothing.
+        """
+        version = self.system_info_fetcher.snapshot_version()
+        if version == self._last_version:
+            return False
+        self._last_version = version
+        return True
+
     def update_data(self):
         """Must be implemented by subclasses to refresh data"""
         raise NotImplementedError("update_data must be implemented in subclasses")
@@ -93,84 +228,96 @@ class OverviewLayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # OS information label
-        self.os_label = QLabel("<b>Operating system:</b> ")
+        # OS information label (static bold prefix, dynamic tail)
+        self.os_prefix = "<b>Operating system:</b> "
+        self.os_label = _prefixed_label(self.os_prefix)
         self.layout.addWidget(self.os_label)
 
         # CPU usage section
-        self.cpu_label = QLabel("<b>CPU:</b> ")
+        self.cpu_prefix = "<b>CPU:</b> "
+        self.cpu_label = _prefixed_label(self.cpu_prefix)
         self.layout.addWidget(self.cpu_label)
         self.cpu_usage_progress = QProgressBar()
         self.cpu_usage_progress.setTextVisible(True)
+        # Format template set once; per-tick updates only call setValue
+        self.cpu_usage_progress.setFormat("CPU-Auslastung: %p%")
         self.layout.addWidget(self.cpu_usage_progress)
 
         # RAM usage section
-        self.ram_label = QLabel("<b>RAM:</b> ")
+        self.ram_prefix = "<b>RAM:</b> "
+        self.ram_label = _prefixed_label(self.ram_prefix)
         self.layout.addWidget(self.ram_label)
         self.ram_usage_progress = QProgressBar()
         self.ram_usage_progress.setTextVisible(True)
+        self.ram_usage_progress.setFormat("memory usage: %p%")
         self.layout.addWidget(self.ram_usage_progress)
 
         # Disk usage section
-        self.disk_label = QLabel("<b>hard drive (C: / Root):</b> ")
+        self.disk_prefix = "<b>Hard drive:</b> "
+        self.disk_label = _prefixed_label(self.disk_prefix)
         self.layout.addWidget(self.disk_label)
         self.disk_usage_progress = QProgressBar()
         self.disk_usage_progress.setTextVisible(True)
+        self.disk_usage_progress.setFormat("Festplattenauslastung: %p%")
+        self._disk_error = False  # Tracks whether the bar shows the error format
         self.layout.addWidget(self.disk_usage_progress)
         
         # Network usage section
-        self.network_label = QLabel("<b>network (Live):</b> ")
+        self.network_prefix = "<b>Network (Live):</b> "
+        self.network_label = _prefixed_label(self.network_prefix)
         self.layout.addWidget(self.network_label)
 
         self.layout.addStretch(1)  # Add spacing at bottom
 
     def update_data(self):
-        # Update OS information
-        self.os_label.setText(f"<b>Operating system:</b> {platform.system()} {platform.release()} ({platform.version()})")
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
+        # Update OS information (cached: the OS does not change at runtime)
+        self.os_label.setText(self.os_prefix + _OS_STR)
 
         # Update CPU information
-        cpu_data = self.system_info_fetcher.get_cpu_info()
+        cpu_data = self._sample_get("cpu", self.system_info_fetcher.get_cpu_info)
         cpu_percent = cpu_data.get("total_percent", 0.0)
         cpu_model = self.system_info_fetcher.get_cpu_model()
-        self.cpu_label.setText(f"<b>CPU:</b> {cpu_model} ({cpu_data.get('physical_cores', 'N/A')} Kerne, {cpu_data.get('logical_cores', 'N/A')} Threads)")
+        self.cpu_label.setText(self.cpu_prefix + f"{cpu_model} ({cpu_data.get('physical_cores', 'N/A')} Kerne, {cpu_data.get('logical_cores', 'N/A')} Threads)")
         self.cpu_usage_progress.setValue(int(cpu_percent))
-        self.cpu_usage_progress.setFormat(f"CPU-Auslastung: {cpu_percent:.1f}%")
 
         # Update RAM information
-        ram_data = self.system_info_fetcher.get_memory_info()
+        ram_data = self._sample_get("memory", self.system_info_fetcher.get_memory_info)
         ram_percent = ram_data.get("ram_percent", 0.0)
         total_ram = ram_data.get("total_ram_gb", 0.0)
         used_ram = ram_data.get("used_ram_gb", 0.0)
-        self.ram_label.setText(f"<b>RAM:</b> {used_ram:.2f} GB / {total_ram:.2f} GB")
+        self.ram_label.setText(self.ram_prefix + f"{used_ram:.2f} GB / {total_ram:.2f} GB")
         self.ram_usage_progress.setValue(int(ram_percent))
-        self.ram_usage_progress.setFormat(f"memory usage: {ram_percent:.1f}%")
 
         # Update disk information (system drive)
         try:
-            # Handle OS-specific root path
-            if platform.system() == "Windows":
-                disk_usage = psutil.disk_usage('C:\\')
-            else:
-                disk_usage = psutil.disk_usage('/')
-            
-            disk_total_gb = round(disk_usage.total / (1024**3), 2)
-            disk_used_gb = round(disk_usage.used / (1024**3), 2)
+            # OS-specific root path is precomputed at import
+            disk_usage = psutil.disk_usage(_DISK_ROOT)
+
+            disk_total_gb = disk_usage.total * _GB
+            disk_used_gb = disk_usage.used * _GB
             disk_percent = disk_usage.percent
 
-            self.disk_label.setText(f"<b>Hard drive:</b> {disk_used_gb:.2f} GB / {disk_total_gb:.2f} GB")
+            self.disk_label.setText(self.disk_prefix + f"{disk_used_gb:.2f} GB / {disk_total_gb:.2f} GB")
+            if self._disk_error:
+                # Restore the normal template after a transient error
+                self._disk_error = False
+                self.disk_usage_progress.setFormat("Festplattenauslastung: %p%")
             self.disk_usage_progress.setValue(int(disk_percent))
-            self.disk_usage_progress.setFormat(f"Festplattenauslastung: {disk_percent:.1f}%")
         except Exception as e:
             # Handle disk access errors
-            self.disk_label.setText(f"<b>Hard drive:</b> Fehler ({e})")
+            self.disk_label.setText(self.disk_prefix + f"Fehler ({e})")
             self.disk_usage_progress.setValue(0)
-            self.disk_usage_progress.setFormat("Not available")
+            self.disk_usage_progress.setFormat("Not available")  # State change, not a per-tick format
+            self._disk_error = True
 
         # Update network information
-        net_io_rates = self.system_info_fetcher.get_network_io_rates()
+        net_io_rates = self._sample_get("io_rates", self.system_info_fetcher.get_network_io_rates)
         sent_kbs = net_io_rates.get("bytes_sent_rate_kbs", 0.0)
         recv_kbs = net_io_rates.get("bytes_recv_rate_kbs", 0.0)
-        self.network_label.setText(f"<b>Network (Live):</b> Upload: {sent_kbs:.1f} KB/s | Download: {recv_kbs:.1f} KB/s")
+        self.network_label.setText(self.network_prefix + f"Upload: {sent_kbs:.1f} KB/s | Download: {recv_kbs:.1f} KB/s")
 
 
 class CPULayout(BaseInfoWidget):
@@ -179,18 +326,24 @@ class CPULayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # CPU specification labels
-        self.cpu_model_label = QLabel("<b>CPU Model:</b> ")
+        # CPU specification labels (static bold prefixes, dynamic tails)
+        self.cpu_model_prefix = "<b>CPU Modell:</b> "
+        self.cpu_model_label = _prefixed_label(self.cpu_model_prefix)
         self.layout.addWidget(self.cpu_model_label)
-        self.physical_cores_label = QLabel("<b>Pphysical cores:</b> ")
+        self.physical_cores_prefix = "<b>Physische Kerne:</b> "
+        self.physical_cores_label = _prefixed_label(self.physical_cores_prefix)
         self.layout.addWidget(self.physical_cores_label)
-        self.logical_cores_label = QLabel("<b>logical cores:</b> ")
+        self.logical_cores_prefix = "<b>Logische Kerne:</b> "
+        self.logical_cores_label = _prefixed_label(self.logical_cores_prefix)
         self.layout.addWidget(self.logical_cores_label)
-        self.current_freq_label = QLabel("<b>Current Frequency:</b> ")
+        self.current_freq_prefix = "<b>Current Frequency:</b> "
+        self.current_freq_label = _prefixed_label(self.current_freq_prefix)
         self.layout.addWidget(self.current_freq_label)
-        self.max_freq_label = QLabel("<b>Maximum Frequency:</b> ")
+        self.max_freq_prefix = "<b>Maximum Frequency:</b> "
+        self.max_freq_label = _prefixed_label(self.max_freq_prefix)
         self.layout.addWidget(self.max_freq_label)
-        self.cpu_total_percent_label = QLabel("<b>Total CPU Usage:</b> ")
+        self.cpu_total_percent_prefix = "<b>Total Usage:</b> "
+        self.cpu_total_percent_label = _prefixed_label(self.cpu_total_percent_prefix)
         self.layout.addWidget(self.cpu_total_percent_label)
 
         self.layout.addSpacing(10)  # Vertical spacing
@@ -212,48 +365,56 @@ class CPULayout(BaseInfoWidget):
             self.cores_grid_layout.addWidget(core_label, row, col_label)
             self.core_labels.append(core_label)
 
-            # Core progress bar
+            # Core progress bar; format template set once, ticks only setValue
             progress_bar = QProgressBar()
             progress_bar.setTextVisible(True)
+            progress_bar.setFormat(f"Kern {i+1}: %p%")
             self.cores_grid_layout.addWidget(progress_bar, row, col_progress)
             self.core_progress_bars.append(progress_bar)
         
         self.layout.addLayout(self.cores_grid_layout)
+        self._prev_core_vals = [-1] * logical_cores  # Last applied integer values
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
         # Get CPU data from fetcher
-        cpu_data = self.system_info_fetcher.get_cpu_info()
+        cpu_data = self._sample_get("cpu", self.system_info_fetcher.get_cpu_info)
         cpu_model = self.system_info_fetcher.get_cpu_model()
 
         # Update CPU specs
-        self.cpu_model_label.setText(f"<b>CPU Modell:</b> {cpu_model}")
-        self.physical_cores_label.setText(f"<b>Physische Kerne:</b> {cpu_data.get('physical_cores', 'N/A')}")
-        self.logical_cores_label.setText(f"<b>Logische Kerne:</b> {cpu_data.get('logical_cores', 'N/A')}")
+        self.cpu_model_label.setText(self.cpu_model_prefix + str(cpu_model))
+        self.physical_cores_label.setText(self.physical_cores_prefix + str(cpu_data.get('physical_cores', 'N/A')))
+        self.logical_cores_label.setText(self.logical_cores_prefix + str(cpu_data.get('logical_cores', 'N/A')))
         
         # Update frequency info
         current_freq = cpu_data.get('current_frequency_mhz', 'N/A')
         if current_freq is not None:
-            self.current_freq_label.setText(f"<b>Current Frequency:</b> {current_freq:.2f} MHz")
+            self.current_freq_label.setText(self.current_freq_prefix + f"{current_freq:.2f} MHz")
         else:
-            self.current_freq_label.setText("<b>Current Frequency:</b> N/A")
+            self.current_freq_label.setText(self.current_freq_prefix + "N/A")
 
         max_freq = cpu_data.get('max_frequency_mhz', 'N/A')
         if max_freq is not None:
-            self.max_freq_label.setText(f"<b>Maximum Frequency:</b> {max_freq:.2f} MHz")
+            self.max_freq_label.setText(self.max_freq_prefix + f"{max_freq:.2f} MHz")
         else:
-            self.max_freq_label.setText("<b>Maximum Frequency:</b> N/A")
+            self.max_freq_label.setText(self.max_freq_prefix + "N/A")
 
         # Update total CPU usage
         total_percent = cpu_data.get('total_percent', 0.0)
-        self.cpu_total_percent_label.setText(f"<b>Total Usage:</b> {total_percent:.1f}%")
+        self.cpu_total_percent_label.setText(self.cpu_total_percent_prefix + f"{total_percent:.1f}%")
 
-        # Update per-core usage
+        # Update per-core usage; skip bars whose integer value is unchanged
         per_cpu_percent = cpu_data.get('per_cpu_percent', [])
-        for i, percent in enumerate(per_cpu_percent):
-            if i < len(self.core_progress_bars):
-                self.core_progress_bars[i].setValue(int(percent))
-                self.core_progress_bars[i].setFormat(f"Kern {i+1}: {percent:.1f}%")
+        bars = self.core_progress_bars
+        prev = self._prev_core_vals
+        for i in range(min(len(bars), len(per_cpu_percent))):
+            value = int(per_cpu_percent[i])
+            if value != prev[i]:
+                prev[i] = value
+                bars[i].setValue(value)
 
 
 class MemoryLayout(BaseInfoWidget):
@@ -262,56 +423,66 @@ class MemoryLayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # RAM section
-        self.ram_total_label = QLabel("<b>Total Memory:</b> ")
+        # RAM section (static bold prefixes, dynamic tails)
+        self.ram_total_prefix = "<b>Total RAM:</b> "
+        self.ram_total_label = _prefixed_label(self.ram_total_prefix)
         self.layout.addWidget(self.ram_total_label)
-        self.ram_available_label = QLabel("<b>Available Memory:</b> ")
+        self.ram_available_prefix = "<b>Available RAM:</b> "
+        self.ram_available_label = _prefixed_label(self.ram_available_prefix)
         self.layout.addWidget(self.ram_available_label)
-        self.ram_used_label = QLabel("<b>Used Memory:</b> ")
+        self.ram_used_prefix = "<b>Used RAM:</b> "
+        self.ram_used_label = _prefixed_label(self.ram_used_prefix)
         self.layout.addWidget(self.ram_used_label)
-        self.ram_percent_label = QLabel("<b>Memory Usage:</b> ")
+        self.ram_percent_prefix = "<b>RAM Usage:</b> "
+        self.ram_percent_label = _prefixed_label(self.ram_percent_prefix)
         self.layout.addWidget(self.ram_percent_label)
         self.ram_progress_bar = QProgressBar()
         self.ram_progress_bar.setTextVisible(True)
+        self.ram_progress_bar.setFormat("Load: %p%")
         self.layout.addWidget(self.ram_progress_bar)
 
         self.layout.addSpacing(20)  # Section spacing
 
         # Swap section
-        self.swap_total_label = QLabel("<b>Total Swap:</b> ")
+        self.swap_total_prefix = "<b>Total Swap:</b> "
+        self.swap_total_label = _prefixed_label(self.swap_total_prefix)
         self.layout.addWidget(self.swap_total_label)
-        self.swap_used_label = QLabel("<b>Used Swap:</b> ")
+        self.swap_used_prefix = "<b>Used Swap:</b> "
+        self.swap_used_label = _prefixed_label(self.swap_used_prefix)
         self.layout.addWidget(self.swap_used_label)
-        self.swap_percent_label = QLabel("<b>Swap Usage:</b> ")
+        self.swap_percent_prefix = "<b>Swap Usage:</b> "
+        self.swap_percent_label = _prefixed_label(self.swap_percent_prefix)
         self.layout.addWidget(self.swap_percent_label)
         self.swap_progress_bar = QProgressBar()
         self.swap_progress_bar.setTextVisible(True)
+        self.swap_progress_bar.setFormat("Load: %p%")
         self.layout.addWidget(self.swap_progress_bar)
 
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
         # Get memory data from fetcher
-        mem_data = self.system_info_fetcher.get_memory_info()
+        mem_data = self._sample_get("memory", self.system_info_fetcher.get_memory_info)
 
         # Update RAM info
-        self.ram_total_label.setText(f"<b>Total RAM:</b> {mem_data.get('total_ram_gb', 0.0):.2f} GB")
-        self.ram_available_label.setText(f"<b>Available RAM:</b> {mem_data.get('available_ram_gb', 0.0):.2f} GB")
-        self.ram_used_label.setText(f"<b>Used RAM:</b> {mem_data.get('used_ram_gb', 0.0):.2f} GB")
+        self.ram_total_label.setText(self.ram_total_prefix + f"{mem_data.get('total_ram_gb', 0.0):.2f} GB")
+        self.ram_available_label.setText(self.ram_available_prefix + f"{mem_data.get('available_ram_gb', 0.0):.2f} GB")
+        self.ram_used_label.setText(self.ram_used_prefix + f"{mem_data.get('used_ram_gb', 0.0):.2f} GB")
         
         ram_percent = mem_data.get('ram_percent', 0.0)
-        self.ram_percent_label.setText(f"<b>RAM Usage:</b> {ram_percent:.1f}%")
+        self.ram_percent_label.setText(self.ram_percent_prefix + f"{ram_percent:.1f}%")
         self.ram_progress_bar.setValue(int(ram_percent))
-        self.ram_progress_bar.setFormat(f"Load: {ram_percent:.1f}%")
 
         # Update Swap info
-        self.swap_total_label.setText(f"<b>Total Swap:</b> {mem_data.get('total_swap_gb', 0.0):.2f} GB")
-        self.swap_used_label.setText(f"<b>Used Swap:</b> {mem_data.get('used_swap_gb', 0.0):.2f} GB")
+        self.swap_total_label.setText(self.swap_total_prefix + f"{mem_data.get('total_swap_gb', 0.0):.2f} GB")
+        self.swap_used_label.setText(self.swap_used_prefix + f"{mem_data.get('used_swap_gb', 0.0):.2f} GB")
         
         swap_percent = mem_data.get('swap_percent', 0.0)
-        self.swap_percent_label.setText(f"<b>Swap Usage:</b> {swap_percent:.1f}%")
+        self.swap_percent_label.setText(self.swap_percent_prefix + f"{swap_percent:.1f}%")
         self.swap_progress_bar.setValue(int(swap_percent))
-        self.swap_progress_bar.setFormat(f"Load: {swap_percent:.1f}%")
 
 
 class NetworkLayout(BaseInfoWidget):
@@ -320,14 +491,18 @@ class NetworkLayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Network summary labels
-        self.hostname_label = QLabel("<b>Hostname:</b> ")
+        # Network summary labels (static bold prefixes, dynamic tails)
+        self.hostname_prefix = "<b>Hostname:</b> "
+        self.hostname_label = _prefixed_label(self.hostname_prefix)
         self.layout.addWidget(self.hostname_label)
-        self.primary_ip_label = QLabel("<b>Primary IP Address:</b> ")
+        self.primary_ip_prefix = "<b>Primary IP Address:</b> "
+        self.primary_ip_label = _prefixed_label(self.primary_ip_prefix)
         self.layout.addWidget(self.primary_ip_label)
-        self.bytes_sent_label = QLabel("<b>Sent:</b> ")
+        self.bytes_sent_prefix = "<b>Sent:</b> "
+        self.bytes_sent_label = _prefixed_label(self.bytes_sent_prefix)
         self.layout.addWidget(self.bytes_sent_label)
-        self.bytes_recv_label = QLabel("<b>Received:</b> ")
+        self.bytes_recv_prefix = "<b>Received:</b> "
+        self.bytes_recv_label = _prefixed_label(self.bytes_recv_prefix)
         self.layout.addWidget(self.bytes_recv_label)
 
         self.layout.addSpacing(20)  # Section spacing
@@ -343,36 +518,187 @@ class NetworkLayout(BaseInfoWidget):
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
         # Get network data from fetcher
-        net_data = self.system_info_fetcher.get_network_info()
+        net_data = self._sample_get("network", self.system_info_fetcher.get_network_info)
 
         # Update summary info
-        self.hostname_label.setText(f"<b>Hostname:</b> {net_data['Hostname']}")
-        self.primary_ip_label.setText(f"<b>Primary IP Address:</b> {net_data['Primary IP']}")
-        self.bytes_sent_label.setText(f"<b>Sent:</b> {net_data['Bytes Sent (GB)']:.2f} GB")
-        self.bytes_recv_label.setText(f"<b>Received:</b> {net_data['Bytes Received (GB)']:.2f} GB")
-
-        # Update interfaces table
+        self.hostname_label.setText(self.hostname_prefix + net_data['Hostname'])
+        self.primary_ip_label.setText(self.primary_ip_prefix + net_data['Primary IP'])
+        self.bytes_sent_label.setText(self.bytes_sent_prefix + f"{net_data['Bytes Sent (GB)']:.2f} GB")
+        self.bytes_recv_label.setText(self.bytes_recv_prefix + f"{net_data['Bytes Received (GB)']:.2f} GB")
+
+        # Flatten the nested interface dict into (name, type, address) rows
+        # first so the table can be sized once; insertRow in a loop shifts
+        # all following rows on every call
         interfaces_data = net_data.get("Interfaces", {})
-        self.interfaces_table.setRowCount(0)  # Clear existing rows
-
-        row_count = 0
+        flat_rows = []
         for if_name, if_addrs in interfaces_data.items():
             for addr_info in if_addrs:
-                self.interfaces_table.insertRow(row_count)
-                self.interfaces_table.setItem(row_count, 0, QTableWidgetItem(if_name))
-
                 # Handle different address types (IPv4, IPv6, MAC)
                 if "IPv4" in addr_info:
-                    self.interfaces_table.setItem(row_count, 1, QTableWidgetItem("IPv4"))
-                    self.interfaces_table.setItem(row_count, 2, QTableWidgetItem(f"{addr_info['IPv4']} (Netzmaske: {addr_info.get('Netzmaske', 'N/A')})"))
+                    flat_rows.append((if_name, "IPv4", f"{addr_info['IPv4']} (Netzmaske: {addr_info.get('Netmask', 'N/A')})"))
                 elif "IPv6" in addr_info:
-                    self.interfaces_table.setItem(row_count, 1, QTableWidgetItem("IPv6"))
-                    self.interfaces_table.setItem(row_count, 2, QTableWidgetItem(addr_info['IPv6']))
+                    flat_rows.append((if_name, "IPv6", addr_info['IPv6']))
                 elif "MAC" in addr_info:
-                    self.interfaces_table.setItem(row_count, 1, QTableWidgetItem("MAC"))
-                    self.interfaces_table.setItem(row_count, 2, QTableWidgetItem(addr_info['MAC']))
-                row_count += 1
+                    flat_rows.append((if_name, "MAC", addr_info['MAC']))
+
+        table = self.interfaces_table
+        table.setUpdatesEnabled(False)  # One repaint after the fill
+        table.setRowCount(len(flat_rows))
+        for row, (if_name, addr_type, address) in enumerate(flat_rows):
+            table.setItem(row, 0, QTableWidgetItem(if_name))
+            table.setItem(row, 1, QTableWidgetItem(addr_type))
+            table.setItem(row, 2, QTableWidgetItem(address))
+        table.setUpdatesEnabled(True)
+
+
+class DiagnosisTableModel(QAbstractTableModel):
+    """
+    Base model for the table views. Holds rows as plain tuples; the attached
+    QTableView only asks data() for visible cells, so a refresh is a model
+    reset instead of allocating a QTableWidgetItem per cell for every row.
+    Subclasses define HEADERS and may override _display() for formatting.
+    """
+    HEADERS = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(index.column(), value)
+        if role == Qt.ItemDataRole.UserRole:
+            # Raw value for the sort proxy, so numeric columns sort numerically
+            return value
+        return None
+
+    def _display(self, column, value):
+        """Formats a raw cell value for display; subclasses override."""
+        return str(value)
+
+    def set_rows(self, rows):
+        """Replaces the backing rows in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class ProcessTableModel(DiagnosisTableModel):
+    """Model over the process list (one tuple per process)."""
+    HEADERS = ["PID", "Name", "CPU (%)", "RAM (RSS MB)", "RAM (VMS MB)", "Threads", "User", "Start Time"]
+    _FLOAT_COLUMNS = {2, 3, 4}  # CPU %, RSS MB, VMS MB
+
+    def _display(self, column, value):
+        if column in self._FLOAT_COLUMNS:
+            return f"{value:.1f}"
+        return str(value)
+
+    def update_rows(self, rows):
+        """
+        Diff-based refresh keyed on PID (column 0). Rows for exited
+        processes are removed, new PIDs are appended, and surviving rows
+        only emit dataChanged when their values actually changed — so
+        repaint cost scales with process churn, not total process count.
+        Display order is left to the view's sort proxy.
+        """
+        if not self._rows:
+            self.set_rows(list(rows))
+            return
+
+        new_by_pid = {row[0]: row for row in rows}
+
+        # Remove exited processes (bottom-up so row indexes stay valid)
+        for idx in range(len(self._rows) - 1, -1, -1):
+            if self._rows[idx][0] not in new_by_pid:
+                self.beginRemoveRows(QModelIndex(), idx, idx)
+                del self._rows[idx]
+                self.endRemoveRows()
+
+        # Update surviving rows in place
+        last_col = len(self.HEADERS) - 1
+        seen = set()
+        for idx, old_row in enumerate(self._rows):
+            pid = old_row[0]
+            seen.add(pid)
+            new_row = new_by_pid[pid]
+            if new_row != old_row:
+                self._rows[idx] = new_row
+                self.dataChanged.emit(self.index(idx, 0), self.index(idx, last_col))
+
+        # Append newly started processes
+        added = [row for row in rows if row[0] not in seen]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+
+
+class LogsTableModel(DiagnosisTableModel):
+    """Model over the logged metric rows straight from the database."""
+    HEADERS = ["Timestamp", "CPU (%)", "RAM (%)", "RAM (GB)", "Bytes Sent (GB)", "Bytes Recv (GB)"]
+    _FORMATS = [None, "%.1f", "%.1f", "%.2f", "%.2f", "%.2f"]  # Per-column printf formats
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._display_cols = None  # Precomputed display strings, one array per column
+
+    def set_rows(self, rows):
+        # Format each numeric column in one vectorized np.char.mod pass
+        # instead of evaluating an f-string per cell; sorting and scrolling
+        # then just index the cached string arrays.
+        if rows:
+            raw = np.asarray(rows, dtype=object)
+            self._display_cols = [
+                [format_timestamp(ts) for ts in raw[:, 0]]
+            ] + [
+                np.char.mod(fmt, raw[:, col].astype(np.float64))
+                for col, fmt in enumerate(self._FORMATS) if fmt
+            ]
+        else:
+            self._display_cols = None
+        super().set_rows(rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and self._display_cols is not None:
+            return self._display_cols[index.column()][index.row()]
+        return super().data(index, role)
+
+
+def _make_table_view(model):
+    """
+    Wraps a model in a QTableView with the shared table look: numeric-aware
+    sorting via a proxy on UserRole, stretch columns, read-only cells.
+    """
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setSortRole(Qt.ItemDataRole.UserRole)
+
+    view = QTableView()
+    view.setModel(proxy)
+    view.setSortingEnabled(True)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    return view
 
 
 class ProcessesLayout(BaseInfoWidget):
@@ -381,56 +707,35 @@ class ProcessesLayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Process table setup
-        self.processes_table = QTableWidget()
-        self.processes_table.setColumnCount(8)
-        self.processes_table.setHorizontalHeaderLabels([
-            "PID", "Name", "CPU (%)", "RAM (RSS MB)", "RAM (VMS MB)", "Threads", "User", "Start Time"
-        ])
-        self.processes_table.setSortingEnabled(True)
-        self.processes_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.processes_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.processes_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        # Model/view setup: the view only renders visible rows
+        self.processes_model = ProcessTableModel(self)
+        self.processes_table = _make_table_view(self.processes_model)
 
         self.layout.addWidget(self.processes_table)
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
         # Get process data from fetcher
-        processes_data = self.system_info_fetcher.get_processes_info()
-        
-        # Populate table with process data
-        self.processes_table.setRowCount(len(processes_data))
-        for row_idx, proc in enumerate(processes_data):
-            # PID
-            self.processes_table.setItem(row_idx, 0, QTableWidgetItem(str(proc.get('pid', 'N/A'))))
-            
-            # Process name
-            self.processes_table.setItem(row_idx, 1, QTableWidgetItem(proc.get('name', 'N/A')))
-            
-            # CPU usage (with numeric sorting support)
-            cpu_item = QTableWidgetItem(f"{proc.get('cpu_percent', 0.0):.1f}")
-            cpu_item.setData(Qt.ItemDataRole.DisplayRole, float(proc.get('cpu_percent', 0.0)))
-            self.processes_table.setItem(row_idx, 2, cpu_item)
-
-            # RAM usage - RSS (Resident Set Size)
-            ram_rss_item = QTableWidgetItem(f"{proc.get('memory_rss_mb', 0.0):.1f}")
-            ram_rss_item.setData(Qt.ItemDataRole.DisplayRole, float(proc.get('memory_rss_mb', 0.0)))
-            self.processes_table.setItem(row_idx, 3, ram_rss_item)
-
-            # RAM usage - VMS (Virtual Memory Size)
-            ram_vms_item = QTableWidgetItem(f"{proc.get('memory_vms_mb', 0.0):.1f}")
-            ram_vms_item.setData(Qt.ItemDataRole.DisplayRole, float(proc.get('memory_vms_mb', 0.0)))
-            self.processes_table.setItem(row_idx, 4, ram_vms_item)
-
-            # Thread count
-            num_threads_item = QTableWidgetItem(str(proc.get('num_threads', 'N/A')))
-            num_threads_item.setData(Qt.ItemDataRole.DisplayRole, int(proc.get('num_threads', 0)))
-            self.processes_table.setItem(row_idx, 5, num_threads_item)
-
-            # User and start time
-            self.processes_table.setItem(row_idx, 6, QTableWidgetItem(proc.get('username', 'N/A')))
-            self.processes_table.setItem(row_idx, 7, QTableWidgetItem(proc.get('create_time', 'N/A')))
+        processes_data = self._sample_get("processes", self.system_info_fetcher.get_processes_info)
+
+        # One tuple per process, in column order
+        rows = [
+            (
+                proc.get('pid', 0),
+                proc.get('name', 'N/A'),
+                proc.get('cpu_percent', 0.0),
+                proc.get('memory_rss_mb', 0.0),
+                proc.get('memory_vms_mb', 0.0),
+                proc.get('num_threads', 0),
+                proc.get('username', 'N/A'),
+                proc.get('create_time', 'N/A')
+            )
+            for proc in processes_data
+        ]
+        self.processes_model.update_rows(rows)
 
 
 class ProgramsLayout(BaseInfoWidget):
@@ -439,49 +744,53 @@ class ProgramsLayout(BaseInfoWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Programs table setup
-        self.programs_table = QTableWidget()
-        self.programs_table.setColumnCount(1)
-        self.programs_table.setHorizontalHeaderLabels(["Program Name"])
-        self.programs_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.programs_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.programs_table.setSortingEnabled(True)
-
-        self.layout.addWidget(self.programs_table)
+        # A flat string list needs no table machinery: QListView only
+        # instantiates delegates for visible rows, and uniform item sizes
+        # plus batched layout keep the initial populate cheap
+        self.programs_model = QStringListModel(self)
+        self.programs_view = QListView()
+        self.programs_view.setModel(self.programs_model)
+        self.programs_view.setUniformItemSizes(True)
+        self.programs_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.programs_view.setBatchSize(100)
+        self.programs_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.layout.addWidget(self.programs_view)
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
-        # Get installed programs from fetcher
-        programs_list = self.system_info_fetcher.get_installed_programs()
-        
-        # Populate table with program names
-        self.programs_table.setRowCount(len(programs_list))
-        for row_idx, program_name in enumerate(programs_list):
-            self.programs_table.setItem(row_idx, 0, QTableWidgetItem(program_name))
+        if not self.snapshot_changed():
+            return  # Nothing new since the last refresh
+
+        # Get installed programs from fetcher (already sorted)
+        programs_list = self._sample_get("programs", self.system_info_fetcher.get_installed_programs)
+        self.programs_model.setStringList(programs_list)
 
 
 class LogsLayout(BaseInfoWidget):
     """System metrics logging view with export/clear functionality"""
     def __init__(self, system_info_fetcher, db_manager, parent=None):
         self.db_manager = db_manager  # Database access object
+        self._last_logs_key = None  # (row count, newest row) last rendered
         super().__init__(system_info_fetcher, parent)
 
     def setup_ui(self):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Log table setup
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(6)
-        self.log_table.setHorizontalHeaderLabels([
-            "Timestamp", "CPU (%)", "RAM (%)", "RAM (GB)", "Bytes Sent (GB)", "Bytes Recv (GB)"
-        ])
-        self.log_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.log_table.setSortingEnabled(True)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Model/view setup: DB rows are stored in the model as-is
+        self.log_model = LogsTableModel(self)
+        self.log_table = _make_table_view(self.log_model)
 
         self.layout.addWidget(self.log_table)
 
+        # Plain label for the empty case; cheaper than a merged table cell
+        # (setSpan forces a full layout recompute)
+        self.no_logs_label = QLabel("Keine Protokolleinträge gefunden.")
+        self.no_logs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_logs_label.hide()
+        self.layout.addWidget(self.no_logs_label)
+
         # Button panel
         button_layout = QHBoxLayout()
         
@@ -504,45 +813,19 @@ class LogsLayout(BaseInfoWidget):
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
-        # Retrieve logs from database
+        # Retrieve logs from database; the model formats cells on demand
         logs = self.db_manager.get_all_logs()
 
-        if logs:
-            # Populate table with log data
-            self.log_table.setRowCount(len(logs))
-            for row_idx, log_entry in enumerate(logs):
-                # Timestamp
-                self.log_table.setItem(row_idx, 0, QTableWidgetItem(log_entry[0]))
-                
-                # CPU usage (with numeric sorting)
-                cpu_item = QTableWidgetItem(f"{log_entry[1]:.1f}")
-                cpu_item.setData(Qt.ItemDataRole.DisplayRole, float(log_entry[1]))
-                self.log_table.setItem(row_idx, 1, cpu_item)
-
-                # RAM percentage (with numeric sorting)
-                ram_percent_item = QTableWidgetItem(f"{log_entry[2]:.1f}")
-                ram_percent_item.setData(Qt.ItemDataRole.DisplayRole, float(log_entry[2]))
-                self.log_table.setItem(row_idx, 2, ram_percent_item)
-
-                # RAM usage in GB (with numeric sorting)
-                ram_gb_item = QTableWidgetItem(f"{log_entry[3]:.2f}")
-                ram_gb_item.setData(Qt.ItemDataRole.DisplayRole, float(log_entry[3]))
-                self.log_table.setItem(row_idx, 3, ram_gb_item)
-
-                # Network sent (with numeric sorting)
-                bytes_sent_item = QTableWidgetItem(f"{log_entry[4]:.2f}")
-                bytes_sent_item.setData(Qt.ItemDataRole.DisplayRole, float(log_entry[4]))
-                self.log_table.setItem(row_idx, 4, bytes_sent_item)
-
-                # Network received (with numeric sorting)
-                bytes_recv_item = QTableWidgetItem(f"{log_entry[5]:.2f}")
-                bytes_recv_item.setData(Qt.ItemDataRole.DisplayRole, float(log_entry[5]))
-                self.log_table.setItem(row_idx, 5, bytes_recv_item)
-        else:
-            # Handle no logs case
-            self.log_table.setRowCount(1)
-            self.log_table.setItem(0, 0, QTableWidgetItem("Keine Protokolleinträge gefunden."))
-            self.log_table.setSpan(0, 0, 1, 6)  # Merge cells for message
+        # Cheap change detection: logs are append-only, so row count plus
+        # the newest row identify the content without hashing everything
+        logs_key = (len(logs), logs[-1] if logs else None)
+        if logs_key == self._last_logs_key:
+            return
+        self._last_logs_key = logs_key
+
+        self.log_model.set_rows(logs)
+        self.no_logs_label.setVisible(not logs)
+        self.log_table.setVisible(bool(logs))
 
     def export_logs_to_csv(self):
         """Export logs to CSV file"""
@@ -551,13 +834,14 @@ class LogsLayout(BaseInfoWidget):
         file_name, _ = QFileDialog.getSaveFileName(self, "Export Logs",
                                                    "system_metrics.csv", "CSV Files (*.csv);;All Files (*)", options=options)
         if file_name:
-            logs = self.db_manager.get_all_logs()
             try:
-                # Write CSV file
-                with open(file_name, 'w', newline='', encoding='utf-8') as csvfile:
+                # Stream rows straight from the database cursor into the
+                # file; a large log table is never held in memory at once.
+                # The big write buffer keeps syscalls rare.
+                with open(file_name, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                     csv_writer = csv.writer(csvfile)
                     csv_writer.writerow(["Timestamp", "CPU (%)", "RAM (%)", "RAM (GB)", "Bytes Sent (GB)", "Bytes Recv (GB)"])
-                    csv_writer.writerows(logs)
+                    csv_writer.writerows(self.db_manager.iter_all_logs())
                 # Success notification
                 QMessageBox.information(self, "Export Successful", f"Logs were successfully exported to:\n{file_name}")
             except Exception as e:
@@ -567,7 +851,7 @@ class LogsLayout(BaseInfoWidget):
     def confirm_clear_logs(self):
         """Confirm log deletion with user"""
         reply = QMessageBox.question(self, "Clear Logs",
-                                     "Are you sure you want to delete ALL system metric logs?\n
+                                     "Are you sure you want to delete ALL system metric logs?\n"
                                      "This action CANNOT be undone.",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                                      QMessageBox.StandardButton.No)
@@ -582,63 +866,262 @@ class DateAxisItem(pg.AxisItem):
     """Custom axis for displaying datetime values"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Locale format string is constant; querying it per tick was the
+        # most expensive part of every axis redraw
+        self._fmt = QLocale.system().dateTimeFormat(QLocale.FormatType.ShortFormat)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _fmt_ts(secs, fmt):
+        """Formats one integer timestamp; cached because tick values
+        repeat heavily while panning and between redraws."""
+        return QDateTime.fromSecsSinceEpoch(secs).toString(fmt)
 
     def tickStrings(self, values, scale, spacing):
         """Convert timestamp values to formatted datetime strings"""
+        fmt = self._fmt
+        fmt_ts = self._fmt_ts
         strings = []
         for val in values:
             try:
-                # Convert Unix timestamp to QDateTime
-                dt = QDateTime.fromSecsSinceEpoch(int(val))
-                # Format according to system locale
-                strings.append(dt.toString(QLocale.system().dateTimeFormat(QLocale.FormatType.ShortFormat)))
-            except ValueError:
+                strings.append(fmt_ts(int(val), fmt))
+            except (ValueError, OverflowError):
                 strings.append('')
         return strings
 
 
+def _cache_curves(plot_widget, curves):
+    """
+    Rasterizes each curve into a device-coordinate pixmap cache so Qt can
+    repaint it without re-stroking the path (e.g. on legend or mouse-over
+    repaints). The cache is stale after zoom/pan, so a range change drops
+    and re-enables it to force a fresh raster at the new scale.
+    """
+    cache_mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+    for curve in curves:
+        curve.setCacheMode(cache_mode)
+
+    def _invalidate(*args):
+        for curve in curves:
+            curve.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+            curve.setCacheMode(cache_mode)
+
+    plot_widget.getViewBox().sigRangeChanged.connect(_invalidate)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _m4_fill(t, y, bins, bin_size, t_out, y_out):
+        """Compiled single-pass M4 kernel filling preallocated outputs."""
+        for b in range(bins):
+            start = b * bin_size
+            end = start + bin_size
+            i_min = start
+            i_max = start
+            for i in range(start + 1, end):
+                if y[i] < y[i_min]:
+                    i_min = i
+                if y[i] > y[i_max]:
+                    i_max = i
+            lo = min(i_min, i_max)
+            hi = max(i_min, i_max)
+            o = b * 4
+            t_out[o] = t[start]
+            y_out[o] = y[start]
+            t_out[o + 1] = t[lo]
+            y_out[o + 1] = y[lo]
+            t_out[o + 2] = t[hi]
+            y_out[o + 2] = y[hi]
+            t_out[o + 3] = t[end - 1]
+            y_out[o + 3] = y[end - 1]
+    @numba.njit(cache=True, fastmath=True)
+    def _rates_fill(ts, sent_gb, recv_gb, sent_out, recv_out):
+        """Compiled network-rate kernel: inputs carry one leading
+        previous sample, outputs hold KB/s clipped at zero. Fuses the
+        diff, gap guard, scaling and clip into one loop."""
+        for i in range(sent_out.shape[0]):
+            dt = ts[i + 1] - ts[i]
+            if dt > 0:
+                s = (sent_gb[i + 1] - sent_gb[i]) * 1048576.0 / dt
+                r = (recv_gb[i + 1] - recv_gb[i]) * 1048576.0 / dt
+                sent_out[i] = s if s > 0.0 else 0.0
+                recv_out[i] = r if r > 0.0 else 0.0
+            else:
+                sent_out[i] = 0.0
+                recv_out[i] = 0.0
+else:
+    _m4_fill = None
+    _rates_fill = None
+
+
+def _m4_downsample(t, y, width_px):
+    """
+    Reduces a series to at most ~4 points per horizontal pixel (M4
+    aggregation: first, min, max, last of each bin). A line drawn through
+    these points is pixel-identical to the full series, so rendering cost
+    depends on the plot width instead of the number of logged samples.
+    Returns (t, y) unchanged when the series is already small enough.
+    Uses the numba kernel when available, otherwise plain numpy.
+    """
+    n = len(t)
+    bins = max(int(width_px), 1)
+    if n <= bins * 4:
+        return t, y
+
+    # Equal-sized index bins; the remainder past the last full bin is
+    # appended verbatim so the newest samples are never dropped
+    bin_size = n // bins
+    m = bins * bin_size
+
+    if _m4_fill is not None:
+        t_out = np.empty(bins * 4, dtype=t.dtype)
+        y_out = np.empty(bins * 4, dtype=y.dtype)
+        _m4_fill(np.ascontiguousarray(t[:m]), np.ascontiguousarray(y[:m]),
+                 bins, bin_size, t_out, y_out)
+    else:
+        tb = t[:m].reshape(bins, bin_size)
+        yb = y[:m].reshape(bins, bin_size)
+
+        idx_min = yb.argmin(axis=1)
+        idx_max = yb.argmax(axis=1)
+        # Column order first/min/max/last keeps each bin sorted by time
+        picks = np.stack([
+            np.zeros(bins, dtype=np.intp),
+            np.minimum(idx_min, idx_max),
+            np.maximum(idx_min, idx_max),
+            np.full(bins, bin_size - 1, dtype=np.intp),
+        ], axis=1)
+        rows = np.arange(bins)[:, None]
+        t_out = tb[rows, picks].ravel()
+        y_out = yb[rows, picks].ravel()
+
+    if m < n:
+        t_out = np.concatenate([t_out, t[m:]])
+        y_out = np.concatenate([y_out, y[m:]])
+    return t_out, y_out
+
+
 class GraphLayout(BaseInfoWidget):
     """Interactive graphs for historical system metrics"""
+
+    _CAPACITY = 1 << 16  # Ring buffer slots per series (~18 h at 1 Hz)
+
     def __init__(self, system_info_fetcher, db_manager, parent=None):
         self.db_manager = db_manager  # Database access
+
+        # Fixed-capacity ring buffers: samples are written in place and
+        # views are passed to setData, so refreshes never reallocate or
+        # copy the whole history
+        cap = self._CAPACITY
+        self._ts_buf = np.empty(cap, dtype=np.float64)
+        self._cpu_buf = np.empty(cap, dtype=np.float32)
+        self._ram_pct_buf = np.empty(cap, dtype=np.float32)
+        self._ram_gb_buf = np.empty(cap, dtype=np.float32)
+        self._sent_rate_buf = np.empty(cap, dtype=np.float32)
+        self._recv_rate_buf = np.empty(cap, dtype=np.float32)
+        self._head = 0  # Next write position (monotonic, modulo capacity)
+        self._count = 0  # Valid samples, capped at capacity
+
+        # State carried between refreshes for incremental appends
+        self._last_ts = None  # Newest timestamp already in the buffers
+        self._prev_sent_gb = None
+        self._prev_recv_gb = None
+
         super().__init__(system_info_fetcher, parent)
 
+    def _append_block(self, ts, cpu, ram_pct, ram_gb, sent_rate, recv_rate):
+        """Bulk-appends column arrays, wrapping around the ring buffers
+        with at most two slice assignments per series."""
+        cap = self._CAPACITY
+        n = len(ts)
+        if n > cap:
+            # Only the newest cap samples can survive anyway
+            ts, cpu, ram_pct, ram_gb, sent_rate, recv_rate = (
+                a[-cap:] for a in (ts, cpu, ram_pct, ram_gb, sent_rate, recv_rate))
+            n = cap
+
+        pos = self._head % cap
+        first = min(n, cap - pos)
+        rest = n - first
+        columns = (
+            (self._ts_buf, ts), (self._cpu_buf, cpu),
+            (self._ram_pct_buf, ram_pct), (self._ram_gb_buf, ram_gb),
+            (self._sent_rate_buf, sent_rate), (self._recv_rate_buf, recv_rate),
+        )
+        for buf, vals in columns:
+            buf[pos:pos + first] = vals[:first]
+            if rest:
+                buf[:rest] = vals[first:]
+        self._head += n
+        self._count = min(self._count + n, cap)
+
+    def _series(self, buf):
+        """Returns the buffer contents in chronological order."""
+        if self._count < self._CAPACITY:
+            return buf[:self._count]  # Not wrapped yet: zero-copy view
+        split = self._head % self._CAPACITY
+        return np.concatenate([buf[split:], buf[:split]])
+
+    def _reset_buffers(self):
+        self._head = 0
+        self._count = 0
+        self._last_ts = None
+        self._prev_sent_gb = None
+        self._prev_recv_gb = None
+
     def setup_ui(self):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Tab widget for different graph types
-        self.graph_tab_widget = QTabWidget()
-        self.layout.addWidget(self.graph_tab_widget)
+        # One GraphicsLayoutWidget with three stacked, X-linked plots:
+        # a single scene and view transform instead of one widget per
+        # metric, and pan/zoom on any plot moves all of them together
+        self.graph_layout_widget = pg.GraphicsLayoutWidget()
+        self.layout.addWidget(self.graph_layout_widget)
 
-        # --- CPU Graph Tab ---
-        self.cpu_plot_widget = pg.PlotWidget(axisItems={'bottom': DateAxisItem(orientation='bottom')})
+        # --- CPU plot (X-axis master) ---
+        self.cpu_plot_widget = self.graph_layout_widget.addPlot(
+            row=0, col=0, axisItems={'bottom': DateAxisItem(orientation='bottom')})
         self.cpu_plot_widget.setTitle("CPU Usage Over Time")
         self.cpu_plot_widget.setLabel('left', "CPU Usage", units='%')
-        self.cpu_plot_widget.setLabel('bottom', "Time")
         self.cpu_plot_widget.addLegend()
         self.cpu_curve = self.cpu_plot_widget.plot(name="CPU (%)", pen='y')  # Yellow line
-        self.graph_tab_widget.addTab(self.cpu_plot_widget, "CPU")
+        _cache_curves(self.cpu_plot_widget, [self.cpu_curve])
 
-        # --- RAM Graph Tab ---
-        self.ram_plot_widget = pg.PlotWidget(axisItems={'bottom': DateAxisItem(orientation='bottom')})
+        # --- RAM plot ---
+        self.ram_plot_widget = self.graph_layout_widget.addPlot(
+            row=1, col=0, axisItems={'bottom': DateAxisItem(orientation='bottom')})
         self.ram_plot_widget.setTitle("RAM Usage Over Time")
         self.ram_plot_widget.setLabel('left', "RAM Usage", units='%')
-        self.ram_plot_widget.setLabel('bottom', "Zeit")
         self.ram_plot_widget.addLegend()
         self.ram_curve_percent = self.ram_plot_widget.plot(name="RAM (%)", pen='b')  # Blue line
         self.ram_curve_gb = self.ram_plot_widget.plot(name="RAM (GB)", pen='r')  # Red line
-        self.graph_tab_widget.addTab(self.ram_plot_widget, "RAM")
+        _cache_curves(self.ram_plot_widget, [self.ram_curve_percent, self.ram_curve_gb])
+        self.ram_plot_widget.setXLink(self.cpu_plot_widget)
 
-        # --- Netzwerk Graph Tab ---
-        self.network_plot_widget = pg.PlotWidget(axisItems={'bottom': DateAxisItem(orientation='bottom')})
+        # --- Netzwerk plot ---
+        self.network_plot_widget = self.graph_layout_widget.addPlot(
+            row=2, col=0, axisItems={'bottom': DateAxisItem(orientation='bottom')})
         self.network_plot_widget.setTitle("Network Throughput Over Time")
         self.network_plot_widget.setLabel('left', "Throughput", units='KB/s')
         self.network_plot_widget.setLabel('bottom', "Time")
         self.network_plot_widget.addLegend()
         self.bytes_sent_rate_curve = self.network_plot_widget.plot(name="Gesendet (KB/s)", pen='c')  # Cyan line
         self.bytes_recv_rate_curve = self.network_plot_widget.plot(name="Empfangen (KB/s)", pen='m')  # Magenta line
-        self.graph_tab_widget.addTab(self.network_plot_widget, "Network")
+        _cache_curves(self.network_plot_widget, [self.bytes_sent_rate_curve, self.bytes_recv_rate_curve])
+        self.network_plot_widget.setXLink(self.cpu_plot_widget)
+
+        # Manual ranging: auto-range would rescan every curve's bounds on
+        # each setData call; update_data sets the ranges itself from the
+        # already-available series extremes
+        all_curves = (self.cpu_curve, self.ram_curve_percent, self.ram_curve_gb,
+                      self.bytes_sent_rate_curve, self.bytes_recv_rate_curve)
+        for plot_widget in (self.cpu_plot_widget, self.ram_plot_widget, self.network_plot_widget):
+            plot_widget.disableAutoRange()
+        for curve in all_curves:
+            curve.setClipToView(True)  # Only stroke the visible x-range
+            if hasattr(curve, "setSkipFiniteCheck"):
+                curve.setSkipFiniteCheck(True)  # Buffers never hold NaN
 
         # Refresh button
         self.refresh_button = QPushButton("Update Graphs")
@@ -648,92 +1131,107 @@ class GraphLayout(BaseInfoWidget):
         self.layout.addStretch(1)  # Bottom spacing
 
     def update_data(self):
-        # Retrieve logs from database
-        logs = self.db_manager.get_all_logs()
-
-        if logs:
-            # Initialize data arrays
-            timestamps = []
-            cpu_percents = []
-            ram_percents = []
-            ram_used_gbs = []
-            bytes_sent_rates = []
-            bytes_recv_rates = []
-
-            # For network rate calculation
-            prev_ts = None
-            prev_bytes_sent_gb = None
-            prev_bytes_recv_gb = None
-
-            # Process each log entry
-            for log_entry in logs:
-                try:
-                    # Convert timestamp to Unix time
-                    current_ts_dt = datetime.strptime(log_entry[0], "%Y-%m-%d %H:%M:%S")
-                    current_ts_unix = current_ts_dt.timestamp()
-
-                    # Extract metrics
-                    current_cpu_percent = log_entry[1]
-                    current_ram_percent = log_entry[2]
-                    current_ram_used_gb = log_entry[3]
-                    current_bytes_sent_gb = log_entry[4]
-                    current_bytes_recv_gb = log_entry[5]
-
-                    # Append to data arrays
-                    timestamps.append(current_ts_unix)
-                    cpu_percents.append(current_cpu_percent)
-                    ram_percents.append(current_ram_percent)
-                    ram_used_gbs.append(current_ram_used_gb)
-
-                    # Calculate network rates if possible
-                    if prev_ts is not None and prev_bytes_sent_gb is not None and prev_bytes_recv_gb is not None:
-                        time_diff_secs = current_ts_unix - prev_ts
-                        if time_diff_secs > 0:
-                            # Calculate rate in KB/s
-                            diff_bytes_sent_gb = current_bytes_sent_gb - prev_bytes_sent_gb
-                            diff_bytes_recv_gb = current_bytes_recv_gb - prev_bytes_recv_gb
-
-                            bytes_sent_rate_kbs = (diff_bytes_sent_gb * (1024**2)) / time_diff_secs
-                            bytes_recv_rate_kbs = (diff_bytes_recv_gb * (1024**2)) / time_diff_secs
-
-                            bytes_sent_rates.append(max(0, bytes_sent_rate_kbs))
-                            bytes_recv_rates.append(max(0, bytes_recv_rate_kbs))
-                        else:
-                            bytes_sent_rates.append(0.0)
-                            bytes_recv_rates.append(0.0)
-                    else:
-                        # First data point
-                        bytes_sent_rates.append(0.0)
-                        bytes_recv_rates.append(0.0)
-                    
-                    # Update previous values for next calculation
-                    prev_ts = current_ts_unix
-                    prev_bytes_sent_gb = current_bytes_sent_gb
-                    prev_bytes_recv_gb = current_bytes_recv_gb
-
-                except (ValueError, TypeError) as e:
-                    # Skip invalid entries
-                    continue
-
-            # Convert to numpy arrays for plotting
-            x_data = np.array(timestamps)
-            y_cpu = np.array(cpu_percents)
-            y_ram_percent = np.array(ram_percents)
-            y_ram_gb = np.array(ram_used_gbs)
-            y_bytes_sent_rate = np.array(bytes_sent_rates)
-            y_bytes_recv_rate = np.array(bytes_recv_rates)
-
-            # Update graph curves
-            self.cpu_curve.setData(x=x_data, y=y_cpu)
-            self.ram_curve_percent.setData(x=x_data, y=y_ram_percent)
-            self.ram_curve_gb.setData(x=x_data, y=y_ram_gb)
-            self.bytes_sent_rate_curve.setData(x=x_data, y=y_bytes_sent_rate)
-            self.bytes_recv_rate_curve.setData(x=x_data, y=y_bytes_recv_rate)
-
+        # Only rows newer than the buffered history are fetched; the
+        # full scan happens once, on the first refresh
+        if self._last_ts is None:
+            logs = self.db_manager.get_all_logs()
+        else:
+            logs = self.db_manager.get_logs_since(int(self._last_ts))
+
+        if not logs:
+            if self._count and self.db_manager.latest_timestamp() is None:
+                # Table was cleared underneath us: drop buffered history
+                self._reset_buffers()
+                self.cpu_curve.setData([], [])
+                self.ram_curve_percent.setData([], [])
+                self.ram_curve_gb.setData([], [])
+                self.bytes_sent_rate_curve.setData([], [])
+                self.bytes_recv_rate_curve.setData([], [])
+            return  # Otherwise: no new rows, curves are current
+
+        # Vectorized ingest: rows usually convert to one contiguous float
+        # matrix in a single C-level pass (timestamps are epoch seconds
+        # after the schema migration); only legacy text timestamps force
+        # the slower object-array path with per-row parsing
+        try:
+            mat = np.asarray(logs, dtype=np.float64)
+            ts = mat[:, 0]
+        except (TypeError, ValueError):
+            mat = np.asarray(logs, dtype=object)
+            ts = np.array([
+                datetime.fromisoformat(v).timestamp()  # C fast path
+                if isinstance(v, str) else float(v)
+                for v in mat[:, 0]
+            ])
+
+        # Keep only entries newer than what the buffers already hold;
+        # old samples stay in place between refreshes
+        if self._last_ts is not None:
+            mask = ts > self._last_ts
+            if not mask.any():
+                return  # No new samples: curves are already current
+            mat = mat[mask]
+            ts = ts[mask]
+
+        cpu = mat[:, 1].astype(np.float64)
+        ram_pct = mat[:, 2].astype(np.float64)
+        ram_gb = mat[:, 3].astype(np.float64)
+        sent_gb = mat[:, 4].astype(np.float64)
+        recv_gb = mat[:, 5].astype(np.float64)
+
+        # Network rates from the deltas to the preceding sample; the state
+        # carried across refreshes supplies the sample before the first
+        # new one, otherwise the first rate is 0
+        if self._prev_sent_gb is not None:
+            ts_prev = np.concatenate(([self._last_ts], ts))
+            sent_prev = np.concatenate(([self._prev_sent_gb], sent_gb))
+            recv_prev = np.concatenate(([self._prev_recv_gb], recv_gb))
+        else:
+            ts_prev = np.concatenate((ts[:1], ts))
+            sent_prev = np.concatenate((sent_gb[:1], sent_gb))
+            recv_prev = np.concatenate((recv_gb[:1], recv_gb))
+        if _rates_fill is not None:
+            # Compiled kernel fuses diff, gap guard, scaling and clip
+            sent_rate = np.empty(len(ts), dtype=np.float64)
+            recv_rate = np.empty(len(ts), dtype=np.float64)
+            _rates_fill(ts_prev, sent_prev, recv_prev, sent_rate, recv_rate)
         else:
-            # Clear graphs if no data
-            self.cpu_curve.setData([], [])
-            self.ram_curve_percent.setData([], [])
-            self.ram_curve_gb.setData([], [])
-            self.bytes_sent_rate_curve.setData([], [])
-            self.bytes_recv_rate_curve.setData([], [])
+            dt = np.diff(ts_prev)
+            safe_dt = np.maximum(dt, 1e-9)
+            sent_rate = np.where(dt > 0, np.diff(sent_prev) * (1024**2) / safe_dt, 0.0)
+            recv_rate = np.where(dt > 0, np.diff(recv_prev) * (1024**2) / safe_dt, 0.0)
+            np.maximum(sent_rate, 0.0, out=sent_rate)
+            np.maximum(recv_rate, 0.0, out=recv_rate)
+
+        self._append_block(ts, cpu, ram_pct, ram_gb, sent_rate, recv_rate)
+        self._last_ts = float(ts[-1])
+        self._prev_sent_gb = float(sent_gb[-1])
+        self._prev_recv_gb = float(recv_gb[-1])
+
+        x_data = self._series(self._ts_buf)
+        cpu_y = self._series(self._cpu_buf)
+        ram_pct_y = self._series(self._ram_pct_buf)
+        ram_gb_y = self._series(self._ram_gb_buf)
+        sent_y = self._series(self._sent_rate_buf)
+        recv_y = self._series(self._recv_rate_buf)
+
+        # Decimate to the plot width before handing data to pyqtgraph;
+        # all plots share the window, so one width suffices
+        width_px = self.graph_layout_widget.viewport().width() or 800
+        self.cpu_curve.setData(*_m4_downsample(x_data, cpu_y, width_px))
+        self.ram_curve_percent.setData(*_m4_downsample(x_data, ram_pct_y, width_px))
+        self.ram_curve_gb.setData(*_m4_downsample(x_data, ram_gb_y, width_px))
+        self.bytes_sent_rate_curve.setData(*_m4_downsample(x_data, sent_y, width_px))
+        self.bytes_recv_rate_curve.setData(*_m4_downsample(x_data, recv_y, width_px))
+
+        # Ranges come from the series extremes (numpy min/max) instead of
+        # pyqtgraph's per-curve bounds walk on every setData
+        x_lo, x_hi = float(x_data[0]), float(x_data[-1])
+        # The RAM and network plots are X-linked to the CPU plot, so one
+        # setXRange on the master moves all three
+        self.cpu_plot_widget.setXRange(x_lo, x_hi, padding=0)
+        self.cpu_plot_widget.setYRange(float(cpu_y.min()), float(cpu_y.max()), padding=0.1)
+        self.ram_plot_widget.setYRange(float(min(ram_pct_y.min(), ram_gb_y.min())),
+                                       float(max(ram_pct_y.max(), ram_gb_y.max())), padding=0.1)
+        self.network_plot_widget.setYRange(float(min(sent_y.min(), recv_y.min())),
+                                           float(max(sent_y.max(), recv_y.max())), padding=0.1)
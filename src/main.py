@@ -23,16 +23,17 @@
 # __init__()                     Sets up window, initializes system info fetcher, DB manager, and UI.
 # setup_tabs()                   Creates and adds all tabs (Overview, CPU, Memory, Network, Processes,
 #                               Programs, Logs, Graphs) to the main QTabWidget.
-# setup_timer()                  Starts a QTimer to periodically log system snapshots and refresh tabs.
-# log_and_update_all_tabs()      Captures system snapshot, logs it in the database,
-#                               and updates all tab widgets.
+# setup_sampler()                Starts the SystemSampler worker thread that collects metrics.
+# setup_timer()                  Starts the sampling timer (10 s) and UI refresh timer (1 s).
+# on_sample(data)                Logs the sampled snapshot in the database
+#                               and updates all tab widgets with the data.
 # closeEvent(event)              Ensures DB connection is closed when app exits.
 
 # Application Flow
 # ----------------
 # 1. On startup, system info fetcher and DB manager are initialized.
 # 2. Tabs are created and added to main window.
-# 3. A timer triggers periodic data logging and UI updates every 100 seconds.
+# 3. An adaptive 1-10 s timer triggers data logging; a 1 s timer refreshes the visible tab.
 # 4. User can view live system data, logs, and historical graphs.
 
 # Technical Details
@@ -80,7 +81,18 @@ print(f"DEBUG: project_root calculated as: {project_root}")
 
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, QLabel
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+
+import pyqtgraph as pg
+
+# GPU-Rendering für die Graphen, falls PyOpenGL installiert ist: der
+# CPU-seitige QPainterPath-Aufbau dominiert setData bei langen Serien.
+# Muss vor dem Erzeugen der PlotWidgets gesetzt werden.
+try:
+    import OpenGL  # noqa: F401 - nur Verfügbarkeitstest
+    pg.setConfigOptions(useOpenGL=True, antialias=False)
+except ImportError:
+    pass  # Software-Rendering als Fallback
 
 # Importiere deine Module
 # WICHTIG: system_info (mit Unterstrich) wurde korrigiert, und alle __init__.py-Dateien müssen existieren!
@@ -88,11 +100,15 @@ from src.system_info import SystemInfoFetcher
 from src.db_manager import LoggingDBManager
 from src.gui_elements import (
     OverviewLayout, CPULayout, MemoryLayout, NetworkLayout,
-    ProcessesLayout, ProgramsLayout, LogsLayout, GraphLayout
+    ProcessesLayout, ProgramsLayout, LogsLayout, GraphLayout,
+    SystemSampler
 )
 
 
 class SystemDiagnosisApp(QMainWindow):
+    # Emitted towards the sampler thread; queued, so sample() runs there
+    sample_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PC Diagnose Tool")
@@ -109,10 +125,11 @@ class SystemDiagnosisApp(QMainWindow):
         self.main_layout.addWidget(self.tab_widget)
 
         self.setup_tabs()
+        self.setup_sampler()
         self.setup_timer()
 
-        # Initialer Log-Eintrag und erste Aktualisierung der Daten in allen Tabs
-        self.log_and_update_all_tabs()
+        # Erste Messung asynchron anstoßen, damit der Start nicht blockiert
+        self.sample_requested.emit()
 
     def setup_tabs(self):
         # Übersicht Tab
@@ -147,29 +164,69 @@ class SystemDiagnosisApp(QMainWindow):
         self.graph_tab_widget = GraphLayout(self.system_info_fetcher, self.db_manager)
         self.tab_widget.addTab(self.graph_tab_widget, "Graphen")
 
+        self.all_tab_widgets = [
+            self.overview_tab_widget, self.cpu_tab_widget, self.memory_tab_widget,
+            self.network_tab_widget, self.processes_tab_widget, self.programs_tab_widget,
+            self.logs_tab_widget, self.graph_tab_widget
+        ]
+        # Verdeckte Tabs werden erst beim Tab-Wechsel nachgezogen
+        self.tab_widget.currentChanged.connect(self.refresh_current_tab)
+
+    def setup_sampler(self):
+        # Messungen (psutil, Prozess-Iteration) laufen auf einem Worker-
+        # Thread; die GUI bekommt nur noch fertige Daten per Signal.
+        self.sampler_thread = QThread(self)
+        self.sampler = SystemSampler(self.system_info_fetcher, self.db_manager)
+        self.sampler.moveToThread(self.sampler_thread)
+        self.sample_requested.connect(self.sampler.sample)
+        self.sampler.sampled.connect(self.on_sample)
+        self.sampler_thread.start()
+
     def setup_timer(self):
-        self.timer = QTimer(self)
-        self.timer.setInterval(100000) # Aktualisiere alle 3 Sekunden
-        self.timer.timeout.connect(self.log_and_update_all_tabs)
-        self.timer.start()
-
-    def log_and_update_all_tabs(self):
-        # 1. System-Snapshot erfassen und in DB loggen
-        snapshot = self.system_info_fetcher.get_system_snapshot()
-        self.db_manager.log_snapshot(snapshot)
-
-        # 2. Alle Tabs aktualisieren
-        self.overview_tab_widget.update_data()
-        self.cpu_tab_widget.update_data()
-        self.memory_tab_widget.update_data()
-        self.network_tab_widget.update_data()
-        self.processes_tab_widget.update_data()
-        self.programs_tab_widget.update_data()
-        self.logs_tab_widget.update_data()
-        self.graph_tab_widget.update_data() # Graphen-Tab auch aktualisieren
+        # Zwei entkoppelte Takte: alle 10 s wird gemessen und geloggt
+        # (der alte 100000-ms-Wert stand im Widerspruch zum Kommentar
+        # "alle 3 Sekunden"), und jede Sekunde wird der sichtbare Tab
+        # nachgezogen, falls er noch ungerenderte Daten hat.
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(10000)
+        self.log_timer.timeout.connect(self.sample_requested)
+        self.log_timer.start()
+
+        self.ui_timer = QTimer(self)
+        self.ui_timer.setInterval(1000)
+        self.ui_timer.timeout.connect(self.refresh_visible_tab)
+        self.ui_timer.start()
+
+    def on_sample(self, data):
+        # Der Snapshot wurde bereits im Sampler-Thread geloggt (inkl.
+        # Commit); aktualisiert wird nur der sichtbare Tab, alle anderen
+        # merken sich die Daten und ziehen beim Tab-Wechsel nach
+        current = self.tab_widget.currentWidget()
+        for tab in self.all_tab_widgets:
+            if tab is current:
+                tab.apply_sample(data)
+            else:
+                tab.defer_sample(data)
+        # Adaptives Messintervall: ruhiges System -> seltener messen,
+        # bewegte CPU-Last -> bis auf 1 s herunter
+        self.log_timer.setInterval(
+            int(self.system_info_fetcher.next_interval() * 1000))
+
+    def refresh_current_tab(self, index):
+        widget = self.tab_widget.widget(index)
+        if widget is not None:
+            widget.refresh_if_dirty()
+
+    def refresh_visible_tab(self):
+        # Billiger No-Op, solange keine neuen Daten vorliegen
+        widget = self.tab_widget.currentWidget()
+        if widget is not None:
+            widget.refresh_if_dirty()
 
     def closeEvent(self, event):
         """Wird aufgerufen, wenn das Hauptfenster geschlossen wird."""
+        self.sampler_thread.quit() # Worker-Thread sauber beenden
+        self.sampler_thread.wait()
         self.db_manager.close() # Datenbankverbindung schließen
         super().closeEvent(event)
 
@@ -25,17 +25,25 @@
 # get_cpu_model()            Returns CPU model name with caching to avoid repeated lookups.
 # get_cpu_info()             Retrieves CPU usage %, core counts, and frequency data.
 # get_memory_info()          Retrieves RAM and swap usage statistics.
+# _discover_primary_ip()     Finds the primary IPv4 from the interface tables, no packet sent.
+# refresh_network_identity() Resolves and caches hostname and primary IP.
 # get_network_info()         Provides hostname, primary IP, bytes sent/received, and interfaces info.
 # get_network_io_rates()     Calculates current network send/receive rates in KB/s.
-# get_processes_info()       Returns a list of active processes with CPU, memory, and metadata.
+# _iter_processes()          Yields per-process info dicts lazily (portable psutil path).
+# _iter_processes_linux()    Fast path parsing /proc directly on Linux.
+# get_processes_info()       Returns processes sorted by CPU; top_n keeps only the N busiest.
 # get_installed_programs()   Lists installed programs depending on OS (Windows/macOS/Linux).
+# snapshot_version()         Returns a counter that changes when a new snapshot is taken.
 # get_system_snapshot()      Collects key metrics into a snapshot dictionary for logging.
+# start_sampling()           Starts a 50 ms background profiler recording cpu/rss/vms.
+# stop_sampling()            Stops the profiler and returns the recorded series.
+# next_interval()            Suggests the adaptive delay until the next snapshot.
 
 # Dependencies
 # ------------
 # - psutil for system monitoring
 # - cpuinfo for detailed CPU identification
-# - platform, socket, datetime, time, os for supporting utilities
+# - platform, socket, time, os for supporting utilities
 
 # Usage
 # -----
@@ -43,20 +51,108 @@
 # Ideal for integration into real-time monitoring GUIs or logging frameworks.
 
 #------------------------------------------------------------------------------
+from array import array
+import heapq
+from operator import itemgetter
+import threading
 import psutil
 import platform
 import socket
-from datetime import datetime
 import time
 import os
-import cpuinfo  
+
+# Cached once: the OS never changes at runtime, and this dispatch runs in
+# every get_installed_programs / process-path decision
+_SYSTEM = platform.system()
+
+# Precomputed reciprocals for the byte->KiB/MiB/GiB conversions scattered
+# through this module: a float multiply is several times cheaper than a
+# divide, and the process loop runs the MiB conversion twice per process.
+_INV_KIB = 1.0 / 1024
+_INV_MIB = 1.0 / (1024**2)
+_INV_GIB = 1.0 / (1024**3)
+
+try:
+    import pwd  # Unix only; resolves uids to usernames on the /proc fast path
+except ImportError:
+    pwd = None
+
+# /proc/<pid>/stat state letters mapped to psutil-style status strings
+_PROC_STATES = {
+    'R': 'running', 'S': 'sleeping', 'D': 'disk-sleep', 'Z': 'zombie',
+    'T': 'stopped', 't': 'tracing-stop', 'X': 'dead', 'I': 'idle',
+    'P': 'parked', 'W': 'waking',
+}
+
 
 class SystemInfoFetcher:
     def __init__(self):
         # Stores the last net_io_counters value for rate calculation
-        self._last_net_io_counters = psutil.net_io_counters()
+        self._last_net_io_counters = psutil.net_io_counters(nowrap=True)
         self._last_net_io_time = time.time()
         self._cpu_model = None  # Cache for the CPU model
+        self._snapshot_version = 0  # Bumped whenever a new snapshot is taken
+        # Process objects kept across calls so cpu_percent(interval=None)
+        # can measure the delta since the previous snapshot, keyed by
+        # (pid, create_time) to survive PID reuse
+        self._proc_cache = {}
+        # Interface list cache: net_if_addrs() is expensive (several ms on
+        # Windows) and the result barely ever changes at snapshot cadence
+        self._ifaddr_cache = None
+        self._ifaddr_ts = 0.0
+        self._IFADDR_TTL = 30.0
+        # Short-lived net_io_counters cache so the several consumers of a
+        # single snapshot tick share one kernel query
+        self._netio_cache = (None, 0.0)
+        # Installed-programs cache: the registry/app-dir scan is the most
+        # expensive collector and its result changes on the order of days,
+        # so it must not re-run on every sampler tick
+        self._programs_cache = None
+        self._programs_ts = 0.0
+        self._PROGRAMS_TTL = 600.0
+        # Hostname and primary IP are stable for the lifetime of the app;
+        # resolving them per call did a routing-table lookup every snapshot
+        self.refresh_network_identity()
+        # CPU usage cache: psutil needs >= 0.1 s between cpu_percent reads
+        # for meaningful values, so results are reused within this window.
+        # The priming call starts the system-wide delta measurement.
+        self._last_cpu_ts = 0.0
+        self._last_cpu_info = None
+        self._CPU_MIN_INTERVAL = 0.5
+        psutil.cpu_percent(interval=None)
+        # Core counts and frequency limits never change while the process
+        # runs, so they are read once here instead of per get_cpu_info call
+        self._physical_cores = psutil.cpu_count(logical=False)
+        self._logical_cores = psutil.cpu_count(logical=True)
+        freq = psutil.cpu_freq()
+        self._freq_min = freq.min if freq else None
+        self._freq_max = freq.max if freq else None
+        # Adaptive sampling state: the last two (time, cpu_percent) points
+        # drive next_interval(), bounded so a quiet system is polled at the
+        # old fixed 10 s cadence and a busy one down to every second
+        self._snapshot_points = (None, None)
+        self._tau = 10.0
+        self._TAU_MIN = 1.0
+        self._TAU_MAX = 10.0
+        self._TAU_GAIN = 1.0
+        # State for the Linux /proc fast path: previous CPU tick counts per
+        # (pid, starttime), the wall-clock time of that sample, and lookup
+        # caches for uid->username and the kernel constants
+        self._proc_times = {}
+        self._proc_times_ts = 0.0
+        self._uid_names = {}
+        # Formatted create_time strings per (pid, create_time): the value
+        # never changes for a live process, so strftime runs once per
+        # process lifetime instead of once per row per refresh
+        self._ctime_cache = {}
+        # Background sampling profiler state (see start_sampling)
+        self._sampling_thread = None
+        self._sampling_stop = None
+        self._sampling_data = None
+        if _SYSTEM == "Linux":
+            self._clk_tck = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+            self._boot_time = psutil.boot_time()
 
     def get_cpu_model(self):
         """
@@ -64,7 +160,9 @@ class SystemInfoFetcher:
         """
         if self._cpu_model is None:
             try:
-                # cpuinfo is an external library
+                # cpuinfo is heavy (its CPUID probe can spawn a subprocess),
+                # so it is imported here on the cold path only
+                import cpuinfo
                 info = cpuinfo.get_cpu_info()
                 self._cpu_model = info.get('brand_original', info.get('brand_raw', 'Unknown'))
             except Exception as e:
@@ -72,70 +170,151 @@ class SystemInfoFetcher:
                 self._cpu_model = "Unknown (Error fetching)"
         return self._cpu_model
 
-    def get_cpu_info(self):
+    def get_cpu_info(self, as_numpy=False):
+        # cpu_percent(interval=0.1) blocked 200 ms per call here; with
+        # interval=None psutil returns the usage since the previous read
+        # without sleeping. Calls inside the minimum interval get the
+        # cached dict, which also keeps the readings accurate (psutil
+        # needs >= 0.1 s between reads).
+        #
+        # as_numpy=True returns per_cpu_percent as a float32 ndarray so
+        # downstream averaging/min/max on many-core machines runs in C
+        # instead of iterating a Python list.
+        now = time.time()
+        if self._last_cpu_info is not None and now - self._last_cpu_ts < self._CPU_MIN_INTERVAL:
+            return self._as_numpy_cpu_info(self._last_cpu_info) if as_numpy else self._last_cpu_info
+
+        freq = psutil.cpu_freq()  # Only the current value changes; one read
         cpu_info = {
-            "total_percent": psutil.cpu_percent(interval=0.1),  # Non-blocking call
-            "per_cpu_percent": psutil.cpu_percent(interval=0.1, percpu=True),
-            "physical_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
-            "current_frequency_mhz": psutil.cpu_freq().current if psutil.cpu_freq() else None,
-            "min_frequency_mhz": psutil.cpu_freq().min if psutil.cpu_freq() else None,
-            "max_frequency_mhz": psutil.cpu_freq().max if psutil.cpu_freq() else None,
+            "total_percent": psutil.cpu_percent(interval=None),
+            "per_cpu_percent": psutil.cpu_percent(interval=None, percpu=True),
+            "physical_cores": self._physical_cores,
+            "logical_cores": self._logical_cores,
+            "current_frequency_mhz": freq.current if freq else None,
+            "min_frequency_mhz": self._freq_min,
+            "max_frequency_mhz": self._freq_max,
         }
-        return cpu_info
+        self._last_cpu_info = cpu_info
+        self._last_cpu_ts = now
+        return self._as_numpy_cpu_info(cpu_info) if as_numpy else cpu_info
+
+    @staticmethod
+    def _as_numpy_cpu_info(cpu_info):
+        """
+        Copy of a cpu_info dict with per_cpu_percent as a float32 array;
+        numpy is imported lazily so callers that never ask for the array
+        shape do not pay for it.
+        """
+        import numpy as np
+        converted = dict(cpu_info)
+        converted["per_cpu_percent"] = np.asarray(
+            cpu_info["per_cpu_percent"], dtype=np.float32)
+        return converted
 
     def get_memory_info(self):
         svmem = psutil.virtual_memory()
         swap = psutil.swap_memory()
         mem_info = {
-            "total_ram_gb": round(svmem.total / (1024**3), 2),
-            "available_ram_gb": round(svmem.available / (1024**3), 2),
-            "used_ram_gb": round(svmem.used / (1024**3), 2),
+            "total_ram_gb": round(svmem.total * _INV_GIB, 2),
+            "available_ram_gb": round(svmem.available * _INV_GIB, 2),
+            "used_ram_gb": round(svmem.used * _INV_GIB, 2),
             "ram_percent": svmem.percent,
-            "total_swap_gb": round(swap.total / (1024**3), 2),
-            "used_swap_gb": round(swap.used / (1024**3), 2),
+            "total_swap_gb": round(swap.total * _INV_GIB, 2),
+            "used_swap_gb": round(swap.used * _INV_GIB, 2),
             "swap_percent": swap.percent
         }
         return mem_info
 
-    def get_network_info(self):
-        net_info = {}
-        net_info["Hostname"] = socket.gethostname()
+    def _net_io_counters_cached(self, ttl=0.1):
+        """
+        Returns psutil.net_io_counters(), reusing a result younger than
+        ttl seconds. get_network_info, get_network_io_rates and the
+        snapshot all read the counters within one tick; with the cache
+        that costs one kernel query instead of three.
+        """
+        counters, ts = self._netio_cache
+        now = time.time()
+        if counters is None or now - ts > ttl:
+            # nowrap keeps the counters monotonic across 32-bit kernel
+            # counter wraps, so the rate subtraction in
+            # get_network_io_rates can never go hugely negative
+            counters = psutil.net_io_counters(nowrap=True)
+            self._netio_cache = (counters, now)
+        return counters
+
+    def _discover_primary_ip(self):
+        """
+        Finds the primary IPv4 address from the interface tables: first
+        AF_INET address on an interface that is up, skipping loopback and
+        link-local ranges. Unlike the old UDP connect to 8.8.8.8 this
+        issues no packet, needs no reachable resolver, and never blocks
+        on a routing lookup.
+        """
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))  # Google DNS to get primary IP
-            net_info["Primary IP"] = s.getsockname()[0]
-            s.close()
+            stats = psutil.net_if_stats()
+            addrs = psutil.net_if_addrs()
+            for interface_name, interface_addrs in addrs.items():
+                st = stats.get(interface_name)
+                if st is None or not st.isup:
+                    continue
+                for addr in interface_addrs:
+                    if addr.family != socket.AF_INET:
+                        continue
+                    if addr.address.startswith("127.") or addr.address.startswith("169.254."):
+                        continue
+                    return addr.address
         except Exception:
-            net_info["Primary IP"] = "N/A"
+            pass
+        return "N/A"
+
+    def refresh_network_identity(self):
+        """
+        Resolves hostname and primary IP once and stores them. Long-running
+        sessions that switch networks can call this again to re-resolve.
+        """
+        self._hostname = socket.gethostname()
+        self._primary_ip = self._discover_primary_ip()
+
+    def get_network_info(self):
+        net_info = {}
+        net_info["Hostname"] = self._hostname
+        net_info["Primary IP"] = self._primary_ip
 
         # Bytes sent/received since system start
-        current_net_io = psutil.net_io_counters()
-        net_info["Bytes Sent (GB)"] = round(current_net_io.bytes_sent / (1024**3), 2)
-        net_info["Bytes Received (GB)"] = round(current_net_io.bytes_recv / (1024**3), 2)
-
-        net_info["Interfaces"] = {}
-        addrs = psutil.net_if_addrs()
-        for interface_name, interface_addrs in addrs.items():
-            net_info["Interfaces"][interface_name] = []
-            for addr in interface_addrs:
-                addr_info = {}
-                if addr.family == socket.AF_INET:
-                    addr_info["IPv4"] = addr.address
-                    addr_info["Netmask"] = addr.netmask
-                elif addr.family == socket.AF_INET6:
-                    addr_info["IPv6"] = addr.address
-                elif addr.family == psutil.AF_LINK:  # MAC address
-                    addr_info["MAC"] = addr.address
-                if addr_info:
-                    net_info["Interfaces"][interface_name].append(addr_info)
+        current_net_io = self._net_io_counters_cached()
+        net_info["Bytes Sent (GB)"] = round(current_net_io.bytes_sent * _INV_GIB, 2)
+        net_info["Bytes Received (GB)"] = round(current_net_io.bytes_recv * _INV_GIB, 2)
+
+        # Interface addresses only change when the network config does, so
+        # the built dict is reused for up to _IFADDR_TTL seconds instead of
+        # calling psutil.net_if_addrs() on every snapshot.
+        now = time.time()
+        if self._ifaddr_cache is None or now - self._ifaddr_ts > self._IFADDR_TTL:
+            interfaces = {}
+            addrs = psutil.net_if_addrs()
+            for interface_name, interface_addrs in addrs.items():
+                interfaces[interface_name] = []
+                for addr in interface_addrs:
+                    addr_info = {}
+                    if addr.family == socket.AF_INET:
+                        addr_info["IPv4"] = addr.address
+                        addr_info["Netmask"] = addr.netmask
+                    elif addr.family == socket.AF_INET6:
+                        addr_info["IPv6"] = addr.address
+                    elif addr.family == psutil.AF_LINK:  # MAC address
+                        addr_info["MAC"] = addr.address
+                    if addr_info:
+                        interfaces[interface_name].append(addr_info)
+            self._ifaddr_cache = interfaces
+            self._ifaddr_ts = now
+        net_info["Interfaces"] = self._ifaddr_cache
         return net_info
 
     def get_network_io_rates(self):
         """
         Calculates the current sending and receiving rates in KB/s.
         """
-        current_net_io = psutil.net_io_counters()
+        current_net_io = self._net_io_counters_cached()
         current_time = time.time()
 
         time_diff = current_time - self._last_net_io_time
@@ -152,8 +331,8 @@ class SystemInfoFetcher:
         sent_rate_bps = bytes_sent_diff / time_diff
         recv_rate_bps = bytes_recv_diff / time_diff
 
-        sent_rate_kbs = sent_rate_bps / 1024
-        recv_rate_kbs = recv_rate_bps / 1024
+        sent_rate_kbs = sent_rate_bps * _INV_KIB
+        recv_rate_kbs = recv_rate_bps * _INV_KIB
 
         self._last_net_io_counters = current_net_io
         self._last_net_io_time = current_time
@@ -163,53 +342,208 @@ class SystemInfoFetcher:
             "bytes_recv_rate_kbs": recv_rate_kbs
         }
 
-    def get_processes_info(self):
-        processes_list = []
-        attrs_to_get = ['pid', 'name', 'status', 'num_threads', 'cpu_percent', 'memory_info', 'username', 'create_time']
+    def _format_create_time(self, key, create_time):
+        """
+        Memoised strftime for process start times: formatted once per
+        process lifetime, not once per row per refresh.
+        """
+        formatted = self._ctime_cache.get(key)
+        if formatted is None:
+            # time.strftime on a struct_time skips the datetime object and
+            # tz machinery that datetime.fromtimestamp().strftime() builds
+            formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(create_time))
+            self._ctime_cache[key] = formatted
+        return formatted
+
+    def _iter_processes(self):
+        """
+        Yields one info dict per running process. Generator so that callers
+        that keep only the top N never materialise the full table.
+        """
+        cpu_count = psutil.cpu_count() or 1
+        seen = set()
 
-        for proc in psutil.process_iter(attrs=attrs_to_get):
+        # Plain process_iter(): since the loop reads everything through
+        # oneshot() anyway, prefetching via attrs= only adds overhead, and
+        # psutil >= 6.0 no longer pays the PID-reuse check per process.
+        for proc in psutil.process_iter():
             try:
-                pinfo = proc.info
-
-                if pinfo is None:
-                    continue
-
-                cpu_percent = proc.cpu_percent(interval=0.01)  # Small interval to get recent CPU usage
-                mem_info = proc.memory_info()
-
-                if mem_info is None:
-                    memory_rss_mb = 0.0
-                    memory_vms_mb = 0.0
-                else:
-                    memory_rss_mb = round(mem_info.rss / (1024**2), 2)
-                    memory_vms_mb = round(mem_info.vms / (1024**2), 2)
-
-                processes_list.append({
-                    "pid": pinfo.get('pid'),
-                    "name": pinfo.get('name'),
-                    "status": pinfo.get('status'),
-                    "num_threads": pinfo.get('num_threads'),
-                    "cpu_percent": cpu_percent,
-                    "memory_rss_mb": memory_rss_mb,
-                    "memory_vms_mb": memory_vms_mb,
-                    "username": pinfo.get('username'),
-                    "create_time": datetime.fromtimestamp(pinfo.get('create_time')).strftime("%Y-%m-%d %H:%M:%S")
-                })
+                # oneshot() batches the underlying /proc reads / syscalls, so
+                # the direct method calls below share one fetch per process
+                # instead of triggering one each.
+                with proc.oneshot():
+                    create_time = proc.create_time()
+
+                    # Reuse the cached Process object so cpu_percent(interval=None)
+                    # returns the usage since the last snapshot instead of sleeping
+                    # 10 ms per process. The first sighting primes the counter and
+                    # reports 0.0; psutil returns the per-process value relative to
+                    # one core, so divide by the core count for a 0-100% scale.
+                    key = (proc.pid, create_time)
+                    seen.add(key)
+                    cached_proc = self._proc_cache.get(key)
+                    if cached_proc is None:
+                        self._proc_cache[key] = proc
+                        proc.cpu_percent(interval=None)  # Prime the counter
+                        cpu_percent = 0.0
+                    else:
+                        cpu_percent = cached_proc.cpu_percent(interval=None) / cpu_count
+                    mem_info = proc.memory_info()
+
+                    if mem_info is None:
+                        memory_rss_mb = 0.0
+                        memory_vms_mb = 0.0
+                    else:
+                        memory_rss_mb = round(mem_info.rss * _INV_MIB, 2)
+                        memory_vms_mb = round(mem_info.vms * _INV_MIB, 2)
+
+                    info = {
+                        "pid": proc.pid,
+                        "name": proc.name(),
+                        "status": proc.status(),
+                        "num_threads": proc.num_threads(),
+                        "cpu_percent": cpu_percent,
+                        "memory_rss_mb": memory_rss_mb,
+                        "memory_vms_mb": memory_vms_mb,
+                        "username": proc.username(),
+                        "create_time": self._format_create_time(key, create_time)
+                    }
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, AttributeError):
                 # Process may have ended or access denied; safely ignore
                 continue
             except Exception:
                 # Catch all unexpected exceptions and continue
                 continue
+            yield info
 
-        # Sort by CPU usage descending
-        processes_list.sort(key=lambda x: x.get('cpu_percent', 0.0), reverse=True)
+        # Drop cache entries for processes that disappeared since the last call
+        for key in list(self._proc_cache):
+            if key not in seen:
+                del self._proc_cache[key]
+                self._ctime_cache.pop(key, None)
 
+    def _iter_processes_linux(self):
+        """
+        Linux fast path for _iter_processes: parses /proc/<pid>/stat and
+        /proc/<pid>/status directly instead of constructing a psutil
+        Process object per PID, whose wrapper and validation overhead
+        dominates large process tables. Yields the same dicts as the
+        portable path; CPU usage comes from utime+stime tick deltas
+        against the previous call.
+        """
+        now = time.time()
+        elapsed = now - self._proc_times_ts
+        cpu_count = self._logical_cores or 1
+        # Percent of total CPU capacity per tick consumed in this window
+        if elapsed > 0:
+            pct_per_tick = 100.0 / (self._clk_tck * elapsed * cpu_count)
+        else:
+            pct_per_tick = 0.0
+        seen = set()
+
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                with open("/proc/%d/stat" % pid) as f:
+                    stat = f.read()
+                # The comm field may contain spaces and parentheses, so the
+                # line is split around the last closing paren
+                lpar = stat.index('(')
+                rpar = stat.rindex(')')
+                name = stat[lpar + 1:rpar]
+                fields = stat[rpar + 2:].split()  # fields[0] is field 3 (state)
+                state = fields[0]
+                utime = int(fields[11])
+                stime = int(fields[12])
+                num_threads = int(fields[17])
+                starttime = int(fields[19])
+                vsize = int(fields[20])
+                rss_pages = int(fields[21])
+
+                key = (pid, starttime)
+                seen.add(key)
+                prev_ticks = self._proc_times.get(key)
+                ticks = utime + stime
+                self._proc_times[key] = ticks
+                if prev_ticks is None:
+                    cpu_percent = 0.0  # First sighting primes the delta
+                else:
+                    cpu_percent = (ticks - prev_ticks) * pct_per_tick
+
+                uid = 0
+                with open("/proc/%d/status" % pid) as f:
+                    for line in f:
+                        if line.startswith('Uid:'):
+                            uid = int(line.split()[1])
+                            break
+                username = self._uid_names.get(uid)
+                if username is None:
+                    if pwd is not None:
+                        try:
+                            username = pwd.getpwuid(uid).pw_name
+                        except KeyError:
+                            username = str(uid)
+                    else:
+                        username = str(uid)
+                    self._uid_names[uid] = username
+
+                create_time = self._boot_time + starttime / self._clk_tck
+                info = {
+                    "pid": pid,
+                    "name": name,
+                    "status": _PROC_STATES.get(state, state),
+                    "num_threads": num_threads,
+                    "cpu_percent": cpu_percent,
+                    "memory_rss_mb": round(rss_pages * self._page_size * _INV_MIB, 2),
+                    "memory_vms_mb": round(vsize * _INV_MIB, 2),
+                    "username": username,
+                    "create_time": self._format_create_time(key, create_time)
+                }
+            except (OSError, ValueError, IndexError):
+                # Process vanished mid-read or the stat line was malformed
+                continue
+            yield info
+
+        self._proc_times_ts = now
+        # Drop tick entries for processes that disappeared since last call
+        for key in list(self._proc_times):
+            if key not in seen:
+                del self._proc_times[key]
+                self._ctime_cache.pop(key, None)
+
+    def get_processes_info(self, top_n=None):
+        """
+        Returns process info dicts sorted by CPU usage descending. With
+        top_n, only the N busiest are kept via a heap (O(N log k)) instead
+        of sorting the whole table.
+        """
+        if _SYSTEM == "Linux":
+            proc_iter = self._iter_processes_linux()
+        else:
+            proc_iter = self._iter_processes()
+
+        # Both process paths always set cpu_percent, so the C-implemented
+        # itemgetter replaces the Python-level .get lambda per comparison
+        if top_n is not None:
+            return heapq.nlargest(top_n, proc_iter, key=itemgetter('cpu_percent'))
+
+        processes_list = list(proc_iter)
+        processes_list.sort(key=itemgetter('cpu_percent'), reverse=True)
         return processes_list
 
     def get_installed_programs(self):
+        # Full registry enumeration (Windows) or app-dir scan per call is
+        # far too expensive for the sampler's 1-10 s cadence; the sorted
+        # list is cached and rebuilt at most every _PROGRAMS_TTL seconds
+        now = time.time()
+        if (self._programs_cache is not None
+                and now - self._programs_ts < self._PROGRAMS_TTL):
+            return self._programs_cache
+
         programs = []
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             try:
                 import winreg  # Only available on Windows
                 keys = [
@@ -221,23 +555,27 @@ class SystemInfoFetcher:
                     r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
                 ]
 
+                seen = set()  # O(1) dedup instead of list membership scans
                 for key in keys:
                     for sub_key in sub_keys:
                         try:
                             with winreg.OpenKey(key, sub_key) as reg_key:
-                                i = 0
-                                while True:
+                                # QueryInfoKey tells us the subkey count up
+                                # front, so the loop is a plain range instead
+                                # of enumerating until an OSError breaks it
+                                num_subkeys = winreg.QueryInfoKey(reg_key)[0]
+                                for i in range(num_subkeys):
                                     try:
                                         program_guid = winreg.EnumKey(reg_key, i)
                                         with winreg.OpenKey(reg_key, program_guid) as program_key:
                                             display_name = winreg.QueryValueEx(program_key, "DisplayName")[0]
-                                            if display_name and display_name not in programs:  # Check for empty names
-                                                programs.append(display_name)
+                                            if display_name:  # Check for empty names
+                                                seen.add(display_name)
                                     except OSError:
-                                        break
-                                    i += 1
+                                        continue  # Subkey without DisplayName
                         except FileNotFoundError:
                             continue
+                programs = list(seen)
             except ImportError:
                 # print("Warning: winreg module not found (Windows only).")
                 pass
@@ -245,7 +583,7 @@ class SystemInfoFetcher:
                 # print("Error fetching installed programs on Windows.")
                 pass
 
-        elif platform.system() == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             app_paths = [
                 "/Applications",
                 os.path.expanduser("~/Applications")
@@ -255,32 +593,135 @@ class SystemInfoFetcher:
                     for item in os.listdir(app_path):
                         if item.endswith(".app"):
                             programs.append(item.replace(".app", ""))
-        elif platform.system() == "Linux":
+        elif _SYSTEM == "Linux":
             # Linux installed programs detection is complex.
             # Possible methods: dpkg-query (Debian/Ubuntu), rpm (RedHat/Fedora),
             # or scanning .desktop files. Placeholder here.
             programs.append("Linux: Program list is complex and not implemented.")  # Placeholder
 
         programs.sort()
+        self._programs_cache = programs
+        self._programs_ts = now
         return programs
 
-    def get_system_snapshot(self):
-        cpu_info = self.get_cpu_info()
-        mem_info = self.get_memory_info()
-        net_info = self.get_network_info()
-
-        cpu_percent = cpu_info.get("total_percent", 0.0)
-        ram_percent = mem_info.get("ram_percent", 0.0)
-        ram_used_gb = mem_info.get("used_ram_gb", 0.0)
-        bytes_sent_gb = net_info.get("Bytes Sent (GB)", 0.0)
-        bytes_recv_gb = net_info.get("Bytes Received (GB)", 0.0)
+    def snapshot_version(self):
+        """
+        Returns a monotonic counter that changes whenever a new snapshot has
+        been taken. UI widgets compare it against the last version they
+        rendered and skip their update entirely when nothing is new.
+        """
+        return self._snapshot_version
 
+    def get_system_snapshot(self):
+        # Only five scalars end up in the snapshot, so this reads them
+        # directly from psutil instead of building the full CPU, memory and
+        # network dicts (interface enumeration, swap, frequencies) just to
+        # throw most of the result away. The detailed get_*_info methods
+        # stay for the on-demand UI panels.
+        #
+        # CPU comes through get_cpu_info's cache on purpose: psutil's
+        # cpu_percent(interval=None) keeps one module-global delta, so a
+        # second direct call in the same tick would span microseconds and
+        # read back 0.0 — and then poison the cache for every CPU tab.
+        self._snapshot_version += 1
+        vm = psutil.virtual_memory()
+        nio = self._net_io_counters_cached()
+
+        # Epoch int instead of a strftime string: the database stores epoch
+        # seconds anyway and the UI formats timestamps only at render time,
+        # so building the text here was wasted work on every tick
         snapshot = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "cpu_percent": cpu_percent,
-            "ram_percent": ram_percent,
-            "ram_used_gb": ram_used_gb,
-            "bytes_sent_gb": bytes_sent_gb,
-            "bytes_recv_gb": bytes_recv_gb
+            "timestamp": int(time.time()),
+            "cpu_percent": self.get_cpu_info()["total_percent"],
+            "ram_percent": vm.percent,
+            "ram_used_gb": round(vm.used * _INV_GIB, 2),
+            "bytes_sent_gb": round(nio.bytes_sent * _INV_GIB, 2),
+            "bytes_recv_gb": round(nio.bytes_recv * _INV_GIB, 2)
         }
+        # Remember the last two points for the adaptive scheduler
+        self._snapshot_points = (self._snapshot_points[1],
+                                 (time.time(), snapshot["cpu_percent"]))
         return snapshot
+
+    def start_sampling(self, interval=0.05, pid=None):
+        """
+        Starts a high-cadence background sampler for profiling sessions.
+        Every `interval` seconds a thread records wall time, the target
+        process's CPU usage (non-blocking delta, normalised to the core
+        count) and its RSS/VMS into flat float arrays — none of the
+        expensive collectors (interfaces, installed programs) run during
+        sampling. pid defaults to the current process. Returns False if a
+        sampler is already running.
+        """
+        if self._sampling_thread is not None:
+            return False
+
+        proc = psutil.Process(pid)
+        proc.cpu_percent(interval=None)  # Prime the delta measurement
+        cpu_count = self._logical_cores or 1
+        stop = threading.Event()
+        data = {
+            "time": array('d'),
+            "cpu_percent": array('d'),
+            "rss_mb": array('d'),
+            "vms_mb": array('d'),
+        }
+
+        def _run():
+            while not stop.is_set():
+                try:
+                    with proc.oneshot():
+                        cpu = proc.cpu_percent(interval=None) / cpu_count
+                        mem = proc.memory_info()
+                except psutil.Error:
+                    break  # Target process ended; keep what was recorded
+                data["time"].append(time.time())
+                data["cpu_percent"].append(cpu)
+                data["rss_mb"].append(mem.rss * _INV_MIB)
+                data["vms_mb"].append(mem.vms * _INV_MIB)
+                stop.wait(interval)
+
+        self._sampling_stop = stop
+        self._sampling_data = data
+        self._sampling_thread = threading.Thread(
+            target=_run, name="sampling-profiler", daemon=True)
+        self._sampling_thread.start()
+        return True
+
+    def stop_sampling(self):
+        """
+        Stops the background sampler and returns the recorded series as a
+        dict of arrays ({time, cpu_percent, rss_mb, vms_mb}), or None if
+        no sampler was running.
+        """
+        if self._sampling_thread is None:
+            return None
+        self._sampling_stop.set()
+        self._sampling_thread.join()
+        self._sampling_thread = None
+        self._sampling_stop = None
+        data = self._sampling_data
+        self._sampling_data = None
+        return data
+
+    def next_interval(self):
+        """
+        Suggests the delay in seconds until the next snapshot, proportional
+        to how fast the CPU load is changing: stable readings stretch the
+        interval toward _TAU_MAX, rapid changes pull it toward _TAU_MIN.
+        Callers reschedule their sampling timer with the returned value.
+        """
+        older, newer = self._snapshot_points
+        if older is None or newer is None:
+            return self._tau
+
+        dt = newer[0] - older[0]
+        dm = abs(newer[1] - older[1])
+        if dt <= 0:
+            return self._tau
+        if dm < 1e-9:
+            tau = self._TAU_MAX  # Nothing moved; back off fully
+        else:
+            tau = self._tau * self._TAU_GAIN * dt / dm
+        self._tau = min(self._TAU_MAX, max(self._TAU_MIN, tau))
+        return self._tau
@@ -29,5 +29,157 @@ class TestLoggingDBManager(unittest.TestCase):
         self.assertTrue(len(logs) > 0)
         self.assertEqual(len(logs[0]), 6)  # 6 columns: timestamp + 5 metrics
 
+    def test_get_all_logs_numpy(self):
+        self.db_manager.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+
+        columns = self.db_manager.get_all_logs_numpy()
+        self.assertIn("cpu_percent", columns)
+        self.assertEqual(len(columns["timestamp"]), len(self.db_manager.get_all_logs()))
+
+    def test_in_memory_checkpoint(self):
+        dbm = LoggingDBManager(db_name="test_mem_logs.db", in_memory=True)
+        try:
+            dbm.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+            # Reads must see shadow-DB rows before any checkpoint ran
+            self.assertTrue(len(dbm.get_all_logs()) > 0)
+            dbm.checkpoint()  # Copies the shadow DB to disk
+            self.assertTrue(len(dbm.get_all_logs()) > 0)
+        finally:
+            dbm.close()
+            if os.path.exists(dbm.db_name):
+                os.remove(dbm.db_name)
+
+    def test_in_memory_preserves_disk_history(self):
+        # Rows logged by a normal session must survive a later in_memory
+        # session: the shadow is seeded from the disk file on open, so the
+        # wholesale checkpoint on close cannot wipe earlier history.
+        db = "test_mem_history.db"
+        disk = LoggingDBManager(db_name=db)
+        disk.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+        disk.close()
+
+        mem = LoggingDBManager(db_name=db, in_memory=True)
+        try:
+            self.assertEqual(len(mem.get_all_logs()), 1)  # Old row visible
+        finally:
+            mem.close()  # Checkpoints the shadow back to disk
+
+        reopened = LoggingDBManager(db_name=db)
+        try:
+            self.assertEqual(len(reopened.get_all_logs()), 1)  # Still there
+        finally:
+            reopened.close()
+            if os.path.exists(reopened.db_name):
+                os.remove(reopened.db_name)
+
+    def test_async_writes(self):
+        dbm = LoggingDBManager(db_name=self.test_db, async_writes=True)
+        dbm.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+        dbm.close()  # Drains the writer thread before closing
+
+        logs = self.db_manager.get_all_logs()
+        self.assertTrue(len(logs) > 0)
+
+    def test_async_writes_in_memory(self):
+        # The async writer must target the shared shadow connection; a
+        # second :memory: connection would be a separate empty database
+        # and the rows would be invisible and lost on close.
+        db = "test_mem_async.db"
+        dbm = LoggingDBManager(db_name=db, in_memory=True, async_writes=True)
+        dbm.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+        dbm.close()  # Drains the writer, then checkpoints to disk
+
+        reopened = LoggingDBManager(db_name=db)
+        try:
+            self.assertEqual(len(reopened.get_all_logs()), 1)
+        finally:
+            reopened.close()
+            if os.path.exists(reopened.db_name):
+                os.remove(reopened.db_name)
+
+    def test_get_logs_since(self):
+        self.db_manager.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+
+        latest = self.db_manager.latest_timestamp()
+        self.assertIsNotNone(latest)
+        # Nothing is newer than the newest row
+        self.assertEqual(self.db_manager.get_logs_since(latest), [])
+        # Everything is newer than 0
+        self.assertEqual(len(self.db_manager.get_logs_since(0)),
+                         len(self.db_manager.get_all_logs()))
+
+    def test_resample_old_logs(self):
+        import time
+        from src.db_manager import Snapshot
+        now = int(time.time())
+        # Ten old samples inside one 5-minute bucket, plus one recent row
+        old = [Snapshot(now - 7200 + i, 100, 200, 3.0, 1.0, 2.0) for i in range(10)]
+        self.db_manager.log_snapshots(old)
+        self.db_manager.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+        before = len(self.db_manager.get_all_logs())
+
+        self.db_manager.resample_old_logs(bucket_s=300, keep_raw_s=3600)
+
+        # Non-destructive: the raw rows are still all there
+        logs = self.db_manager.get_all_logs()
+        self.assertEqual(len(logs), before)
+        self.assertEqual(logs[-1][0], self.db_manager.latest_timestamp())
+
+        # Once the raw rows age out (simulated delete, as the 7-day prune
+        # trigger would), the averaged buckets fill the gap in reads
+        with self.db_manager._write_lock:
+            self.db_manager.conn.execute(
+                "DELETE FROM system_logs WHERE timestamp < ?", (now - 3600,))
+            self.db_manager.conn.commit()
+        self.db_manager._data_version += 1
+        logs = self.db_manager.get_all_logs()
+        self.assertTrue(0 < len(logs) < before)  # Aggregates + recent row
+        self.assertEqual(logs[-1][0], self.db_manager.latest_timestamp())
+
+    def test_legacy_schema_migration(self):
+        import sqlite3
+        legacy_db = "test_legacy_logs.db"
+        legacy_path = os.path.join("PC_Diagnosis_Logs", legacy_db)
+        conn = sqlite3.connect(legacy_path)
+        conn.execute('''CREATE TABLE system_logs (
+            timestamp TEXT PRIMARY KEY, cpu_percent REAL, ram_percent REAL,
+            ram_used_gb REAL, bytes_sent_gb REAL, bytes_recv_gb REAL)''')
+        conn.execute("INSERT INTO system_logs VALUES "
+                     "('2025-06-30 12:00:00', 55.3, 40.0, 3.2, 1.1, 2.2)")
+        conn.commit()
+        conn.close()
+
+        dbm = LoggingDBManager(db_name=legacy_db)
+        try:
+            logs = dbm.get_all_logs()
+            self.assertEqual(len(logs), 1)
+            self.assertIsInstance(logs[0][0], int)  # Timestamp is epoch now
+            self.assertAlmostEqual(logs[0][1], 55.3, places=1)  # Not rescaled down
+        finally:
+            dbm.close()
+            if os.path.exists(legacy_path):
+                os.remove(legacy_path)
+
+    def test_flush_invalidates_cache(self):
+        # A read between insert and commit caches the pre-commit result;
+        # flush() must bump the data version so the next read re-queries.
+        dbm = LoggingDBManager(db_name=self.test_db, auto_commit=False)
+        try:
+            dbm.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+            dbm.get_all_logs()  # Pooled readers see nothing yet; gets cached
+            dbm.flush()
+            self.assertEqual(len(dbm.get_all_logs()), 1)
+        finally:
+            dbm.close()
+
+    def test_batched_logging(self):
+        # With auto_commit=False inserts are buffered; leaving the context
+        # manager commits them once and closes the manager.
+        with LoggingDBManager(db_name=self.test_db, auto_commit=False) as dbm:
+            dbm.log_system_metrics(10.5, 20.5, 3.2, 1.1, 2.2)
+
+        logs = self.db_manager.get_all_logs()
+        self.assertTrue(len(logs) > 0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file